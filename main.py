@@ -194,6 +194,8 @@ def run_single_session(args):
             "submit_applications": args.submit,
             "manual_approval": not args.no_manual_approval,
             "headless": os.getenv("HEADLESS_MODE", "false").lower() == "true",
+            "match_jobs_per_prompt": int(os.getenv("MATCH_JOBS_PER_PROMPT", "1")),
+            "generate_concurrency": int(os.getenv("GENERATE_CONCURRENCY", "2")),
             "location": USER_INFO.get("location", "United Kingdom"),
             "search_terms": [
                 "Data Scientist graduate",
@@ -10,8 +10,10 @@ Coordinates the entire job application workflow:
 
 from typing import List, Dict, Any, Optional
 import sys
+import threading
 from pathlib import Path
 
+from modules.scraping.base_scraper import BaseScraper
 from modules.scraping.linkedin_scraper import create_linkedin_scraper
 from modules.scraping.job_models import JobPosting
 from modules.generation.material_generator import create_material_generator
@@ -43,6 +45,7 @@ class JobHuntOrchestrator:
         self.qc_log = get_qc_log()
         self.ollama = get_ollama_client()
         self.scraper = None  # Keep scraper instance for Phase 2
+        self.material_gen = None  # Shared across jobs (created after validation)
 
         # Statistics
         self.stats = {
@@ -62,14 +65,9 @@ class JobHuntOrchestrator:
         """
         self.logger.info("Validating setup...")
 
-        # Check Ollama connection
-        if not self.ollama.check_connection():
-            self.logger.error("❌ Ollama connection failed")
-            return False
-
-        # Check models
-        if not self.ollama.check_models():
-            self.logger.error("❌ Required models not available")
+        # Check Ollama connection and models (one /api/tags request)
+        if not self.ollama.validate():
+            self.logger.error("❌ Ollama connection failed or required models not available")
             return False
 
         # Check user info
@@ -129,12 +127,15 @@ class JobHuntOrchestrator:
 
         return jobs
 
-    def process_job(self, job: JobPosting) -> Optional[Dict[str, Any]]:
+    def process_job(
+        self, job: JobPosting, materials: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
         """
-        Process a single job: match projects and generate materials
+        Record a single job and its generated materials in the QC log
 
         Args:
             job: Job posting
+            materials: Result of generate_materials for the job (None if generation failed)
 
         Returns:
             Dictionary containing generated materials or None if failed
@@ -156,10 +157,6 @@ class JobHuntOrchestrator:
                 keywords_extracted=job.keywords,
             )
 
-            # Generate materials
-            material_gen = create_material_generator(self.config["user_info"])
-            materials = material_gen.generate_materials(job)
-
             if not materials:
                 self.logger.error("Failed to generate materials")
                 self.stats["errors"] += 1
@@ -275,20 +272,30 @@ class JobHuntOrchestrator:
 
         self.qc_log.start_run(mode=mode, region=region, platforms=platforms)
 
+        # Load the text model in the background while scraping runs
+        self.material_gen = create_material_generator(self.config["user_info"])
+        threading.Thread(target=self.material_gen.warmup, daemon=True).start()
+
         # Scrape jobs from each platform
         all_jobs = []
         max_jobs_total = self.config.get("max_jobs", 5)
 
-        for platform in platforms:
-            if len(all_jobs) >= max_jobs_total:
-                break
-
-            remaining = max_jobs_total - len(all_jobs)
-            search_terms = self.config.get("search_terms", ["Data Scientist graduate"])
-
-            jobs = self.scrape_jobs(platform, search_terms, remaining)
-            all_jobs.extend(jobs)
-            self.stats["jobs_scraped"] += len(jobs)
+        try:
+            for platform in platforms:
+                if len(all_jobs) >= max_jobs_total:
+                    break
+
+                remaining = max_jobs_total - len(all_jobs)
+                search_terms = self.config.get("search_terms", ["Data Scientist graduate"])
+
+                jobs = self.scrape_jobs(platform, search_terms, remaining)
+                all_jobs.extend(jobs)
+                self.stats["jobs_scraped"] += len(jobs)
+        finally:
+            # Stop the shared Playwright driver and browser once scraping is done,
+            # unless a scraper is kept open for Phase 2 (torn down after submission)
+            if not self.scraper:
+                BaseScraper.shutdown()
 
         self.logger.info(f"\n✓ Total jobs scraped: {len(all_jobs)}")
 
@@ -297,15 +304,31 @@ class JobHuntOrchestrator:
             self.qc_log.finalize_run()
             return {"success": False, "error": "No jobs found"}
 
+        # Match projects for every job up front with concurrent LLM requests.
+        # If the batch fails, each job is matched on its own during generation.
+        try:
+            all_matches = self.material_gen.project_matcher.match_projects_batch(
+                all_jobs, jobs_per_prompt=self.config.get("match_jobs_per_prompt", 1)
+            )
+        except Exception as e:
+            self.logger.error(f"Batch project matching failed, matching per job: {e}", exc_info=True)
+            all_matches = [None] * len(all_jobs)
+
+        # Generate materials for several jobs at once so Ollama always has queued
+        # work; a job that fails comes back as None without affecting the others
+        all_materials = self.material_gen.generate_materials_batch(
+            all_jobs, all_matches, max_concurrent=self.config.get("generate_concurrency", 2)
+        )
+
         # Process each job
         processed_jobs = []
 
-        for i, job in enumerate(all_jobs, 1):
+        for i, (job, generated) in enumerate(zip(all_jobs, all_materials), 1):
             self.logger.info(f"\n{'#'*60}")
             self.logger.info(f"JOB {i}/{len(all_jobs)}")
             self.logger.info(f"{'#'*60}")
 
-            materials = self.process_job(job)
+            materials = self.process_job(job, generated)
 
             if materials:
                 processed_jobs.append({
@@ -362,6 +385,7 @@ class JobHuntOrchestrator:
                 self.logger.info("✓ Browser session closed")
             except:
                 pass
+            BaseScraper.shutdown()
 
         # Finalize quality control log
         self.qc_log.finalize_run()
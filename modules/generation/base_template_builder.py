@@ -0,0 +1,102 @@
+"""
+Base Template Builder
+Shared prompt loading and Word document scaffolding for the CV and cover letter builders
+"""
+
+import logging
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from docx import Document
+from docx.shared import Pt, Inches
+from docx.enum.style import WD_STYLE_TYPE
+
+from modules.generation.ollama_client import OllamaClient
+
+# Gap above a block that used to be separated by an empty paragraph
+BLOCK_GAP = Pt(12)
+
+
+class BaseTemplateBuilder:
+    """Base class for builders where the LLM generates content and Python handles formatting"""
+
+    # Prompt files used by the builder, read from prompts_dir/PROMPT_SUBDIR
+    PROMPT_SUBDIR = ''
+    SECTION_PROMPTS: Tuple[str, ...] = ()
+
+    # Paragraph styles baked into the template: name -> (size, bold, alignment or None)
+    STYLES: Dict[str, tuple] = {}
+
+    # Page margins in inches: (top, bottom, left, right)
+    MARGINS: Tuple[float, float, float, float] = (1, 1, 1, 1)
+
+    # Serialized blank document (margins + styles), built on first use per subclass
+    _template_bytes: Optional[bytes] = None
+
+    def __init__(self, ollama_client: OllamaClient, user_info: dict, prompts_dir: Path):
+        self.ollama = ollama_client
+        self.user_info = user_info
+        self.prompts_dir = prompts_dir
+        self.logger = logging.getLogger(type(self).__module__)
+        self.max_retries = 3
+
+        # Section prompts never change between jobs - load once, fail fast if missing
+        self._prompt_templates = self._load_prompt_templates()
+
+    def _load_prompt_templates(self) -> Dict[str, str]:
+        """Read every section prompt this builder uses"""
+        templates = {}
+        for prompt_file in self.SECTION_PROMPTS:
+            prompt_path = self.prompts_dir / self.PROMPT_SUBDIR / prompt_file
+            if not prompt_path.exists():
+                raise FileNotFoundError(f"Section prompt not found: {prompt_path}")
+            templates[prompt_file] = prompt_path.read_text(encoding='utf-8')
+        return templates
+
+    def _build_prompt(self, prompt_file: str, context: Dict[str, str]) -> str:
+        """Fill all placeholders of a preloaded section prompt in a single pass"""
+        return self._prompt_templates[prompt_file].format_map(context)
+
+    @classmethod
+    def _get_template_bytes(cls) -> bytes:
+        """Build (once) a blank document with this builder's margins and styles preset"""
+        # Looked up on the subclass itself so CV and cover letter templates don't share a cache
+        if cls.__dict__.get('_template_bytes') is None:
+            doc = Document()
+
+            # Set margins
+            top, bottom, left, right = cls.MARGINS
+            for section in doc.sections:
+                section.top_margin = Inches(top)
+                section.bottom_margin = Inches(bottom)
+                section.left_margin = Inches(left)
+                section.right_margin = Inches(right)
+
+            # Named paragraph styles replace per-run font assignment
+            for name, (size, bold, align) in cls.STYLES.items():
+                style = doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+                style.base_style = doc.styles['Normal']
+                style.font.size = size
+                style.font.bold = bold
+                if align is not None:
+                    style.paragraph_format.alignment = align
+
+            buffer = BytesIO()
+            doc.save(buffer)
+            cls._template_bytes = buffer.getvalue()
+        return cls._template_bytes
+
+    def _new_document(self) -> Document:
+        """Open a fresh copy of the blank template"""
+        return Document(BytesIO(self._get_template_bytes()))
+
+    def _add_paragraph(self, doc: Document, text: str, text_lines: List[str],
+                       style: Optional[str] = None, space_before: Optional[Pt] = None):
+        """Add a styled paragraph and record its text for the plain-text copy"""
+        if text.strip():
+            text_lines.append(text)
+        para = doc.add_paragraph(text, style=style)
+        if space_before is not None:
+            # Spacing lives on the paragraph itself - no empty <w:p> spacers
+            para.paragraph_format.space_before = space_before
+        return para
@@ -3,27 +3,28 @@ Cover Letter Template Builder
 Generates cover letters using modular template approach with company research
 """
 
-import logging
-from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from docx import Document
-from docx.shared import Pt, Inches
+from docx.shared import Pt
 
-from modules.generation.ollama_client import OllamaClient
+from modules.generation.base_template_builder import BaseTemplateBuilder, BLOCK_GAP
 
 
-class CoverLetterTemplateBuilder:
+class CoverLetterTemplateBuilder(BaseTemplateBuilder):
     """Builds cover letters using template approach with web research"""
 
-    def __init__(self, ollama_client: OllamaClient, user_info: dict, prompts_dir: Path):
-        self.ollama = ollama_client
-        self.user_info = user_info
-        self.prompts_dir = prompts_dir
-        self.logger = logging.getLogger(__name__)
-        self.max_retries = 3
+    PROMPT_SUBDIR = 'cover_letter_sections'
+    SECTION_PROMPTS = ('opening.txt', 'achievements.txt', 'closing.txt')
 
-    def generate_cover_letter(self, job, company_research: Dict[str, str], matched_projects: List[Dict]) -> Optional[Document]:
+    STYLES = {
+        'ATS Name': (Pt(14), True, None),
+        'ATS Contact': (Pt(10), False, None),
+        'ATS Body': (Pt(11), False, None),
+    }
+    MARGINS = (1, 1, 1, 1)
+
+    def generate_cover_letter(self, job, company_research: Dict[str, str], matched_projects: List[Dict]) -> Optional[Tuple[Document, str]]:
         """
         Generate cover letter using template approach with company research.
 
@@ -33,7 +34,7 @@ class CoverLetterTemplateBuilder:
             matched_projects: List of matched projects
 
         Returns:
-            Document object or None if generation fails
+            Tuple of (Document, plain text) or None if generation fails
         """
         self.logger.info("Generating cover letter using template approach...")
 
@@ -56,10 +57,8 @@ class CoverLetterTemplateBuilder:
             self.logger.warning("Closing generation failed, using fallback")
             closing = self._fallback_closing(job)
 
-        # Create Word document
-        doc = self._create_word_document(static_content, opening, achievements, closing, job)
-
-        return doc
+        # Create Word document (text collected alongside)
+        return self._create_word_document(static_content, opening, achievements, closing, job)
 
     def _prepare_header(self) -> Dict[str, str]:
         """Prepare static header content"""
@@ -77,33 +76,34 @@ class CoverLetterTemplateBuilder:
     def _generate_opening(self, job, company_research: Dict[str, str]) -> Optional[str]:
         """Generate personalized opening paragraph based on company research"""
 
+        # Prompt is identical across attempts - build it once
+        context = {
+            'job_title': job.title,
+            'company_name': job.company,
+            'company_mission': company_research.get('mission', 'N/A'),
+            'company_products': company_research.get('products', 'N/A'),
+            'company_news': company_research.get('recent_news', 'N/A'),
+            'tech_stack': company_research.get('tech_stack', 'N/A'),
+            'job_description': job.description[:800]
+        }
+        try:
+            prompt = self._build_prompt('opening.txt', context)
+        except Exception as e:
+            self.logger.error(f"Error preparing opening prompt: {e}")
+            return None
+
         for attempt in range(1, self.max_retries + 1):
             try:
                 self.logger.info(f"Generating opening paragraph (attempt {attempt}/{self.max_retries})")
 
-                # Load prompt
-                prompt_path = self.prompts_dir / 'cover_letter_sections' / 'opening.txt'
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    prompt_template = f.read()
-
-                # Prepare context
-                context = {
-                    'job_title': job.title,
-                    'company_name': job.company,
-                    'company_mission': company_research.get('mission', 'N/A'),
-                    'company_products': company_research.get('products', 'N/A'),
-                    'company_news': company_research.get('recent_news', 'N/A'),
-                    'tech_stack': company_research.get('tech_stack', 'N/A'),
-                    'job_description': job.description[:800]
-                }
-
-                prompt = prompt_template.format(**context)
-
                 # Generate with low temperature for consistency
                 opening = self.ollama.generate_text(
                     prompt=prompt,
                     temperature=0.4,
-                    max_tokens=200
+                    max_tokens=200,
+                    # Retries need a fresh sample; only usable output is cached
+                    cache=attempt == 1,
+                    accept=lambda text: len(text.strip()) > 50
                 )
 
                 if opening and len(opening.strip()) > 50:
@@ -118,43 +118,44 @@ class CoverLetterTemplateBuilder:
     def _generate_achievements(self, job, company_research: Dict[str, str], matched_projects: List[Dict]) -> Optional[str]:
         """Generate achievement paragraph based on job requirements and company research"""
 
-        for attempt in range(1, self.max_retries + 1):
-            try:
-                self.logger.info(f"Generating achievements (attempt {attempt}/{self.max_retries})")
-
-                # Load prompt
-                prompt_path = self.prompts_dir / 'cover_letter_sections' / 'achievements.txt'
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    prompt_template = f.read()
-
-                # Prepare work experience
-                work_experience = """Data Analytics Intern at RCCG Department of Public Health (January 2024 – November 2024):
+        # Prepare work experience
+        work_experience = """Data Analytics Intern at RCCG Department of Public Health (January 2024 – November 2024):
 - Processed 500+ monthly financial transactions maintaining 99.8% accuracy
 - Analyzed payment patterns to identify trends for health outreach programs
 - Generated weekly reports supporting data-driven clinic operations
 - Collaborated with medical staff to optimize workflows, reducing processing time by 25%"""
 
-                # Prepare projects
-                projects_text = "\n\n".join([
-                    f"{p['title']}\n{p['description']}\nTechnologies: {', '.join(p['technologies'])}"
-                    for p in matched_projects[:3]
-                ])
-
-                context = {
-                    'job_title': job.title,
-                    'job_description': job.description[:1000],
-                    'company_name': job.company,
-                    'tech_stack': company_research.get('tech_stack', 'N/A'),
-                    'work_experience': work_experience,
-                    'projects': projects_text
-                }
+        # Prepare projects
+        projects_text = "\n\n".join(
+            f"{p['title']}\n{p['description']}\nTechnologies: {', '.join(p['technologies'])}"
+            for p in matched_projects[:3]
+        )
+
+        # Prompt is identical across attempts - build it once
+        context = {
+            'job_title': job.title,
+            'job_description': job.description[:1000],
+            'company_name': job.company,
+            'tech_stack': company_research.get('tech_stack', 'N/A'),
+            'work_experience': work_experience,
+            'projects': projects_text
+        }
+        try:
+            prompt = self._build_prompt('achievements.txt', context)
+        except Exception as e:
+            self.logger.error(f"Error preparing achievements prompt: {e}")
+            return None
 
-                prompt = prompt_template.format(**context)
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                self.logger.info(f"Generating achievements (attempt {attempt}/{self.max_retries})")
 
                 achievements = self.ollama.generate_text(
                     prompt=prompt,
                     temperature=0.4,
-                    max_tokens=300
+                    max_tokens=300,
+                    cache=attempt == 1,
+                    accept=lambda text: len(text.strip()) > 100
                 )
 
                 if achievements and len(achievements.strip()) > 100:
@@ -169,28 +170,29 @@ class CoverLetterTemplateBuilder:
     def _generate_closing(self, job, company_research: Dict[str, str]) -> Optional[str]:
         """Generate closing paragraph"""
 
+        # Prompt is identical across attempts - build it once
+        context = {
+            'job_title': job.title,
+            'company_name': job.company,
+            'company_mission': company_research.get('mission', 'N/A'),
+            'job_description': job.description[:500]
+        }
+        try:
+            prompt = self._build_prompt('closing.txt', context)
+        except Exception as e:
+            self.logger.error(f"Error preparing closing prompt: {e}")
+            return None
+
         for attempt in range(1, self.max_retries + 1):
             try:
                 self.logger.info(f"Generating closing (attempt {attempt}/{self.max_retries})")
 
-                # Load prompt
-                prompt_path = self.prompts_dir / 'cover_letter_sections' / 'closing.txt'
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    prompt_template = f.read()
-
-                context = {
-                    'job_title': job.title,
-                    'company_name': job.company,
-                    'company_mission': company_research.get('mission', 'N/A'),
-                    'job_description': job.description[:500]
-                }
-
-                prompt = prompt_template.format(**context)
-
                 closing = self.ollama.generate_text(
                     prompt=prompt,
                     temperature=0.4,
-                    max_tokens=150
+                    max_tokens=150,
+                    cache=attempt == 1,
+                    accept=lambda text: len(text.strip()) > 30
                 )
 
                 if closing and len(closing.strip()) > 30:
@@ -218,83 +220,47 @@ class CoverLetterTemplateBuilder:
         """Generic closing"""
         return f"I am eager to bring my technical skills and enthusiasm to {job.company}. I would welcome the opportunity to discuss how my background aligns with your team's goals. Thank you for your consideration."
 
-    def _create_word_document(self, header: Dict[str, str], opening: str, achievements: str, closing: str, job) -> Document:
-        """Create formatted Word document"""
-        doc = Document()
-
-        # Set margins
-        sections = doc.sections
-        for section in sections:
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
+    def _create_word_document(self, header: Dict[str, str], opening: str, achievements: str, closing: str, job) -> Tuple[Document, str]:
+        """Create formatted Word document, returning it with its plain text"""
+        doc = self._new_document()
+        text_lines: List[str] = []
 
         # Header - Name
-        name_para = doc.add_paragraph(header['NAME'])
-        if name_para.runs:
-            name_para.runs[0].font.size = Pt(14)
-            name_para.runs[0].bold = True
+        self._add_paragraph(doc, header['NAME'], text_lines, style='ATS Name')
 
         # Header - Contact Line 1
         contact1 = f"{header['LOCATION']} | {header['PHONE']} | {header['EMAIL']}"
-        contact1_para = doc.add_paragraph(contact1)
-        if contact1_para.runs:
-            contact1_para.runs[0].font.size = Pt(10)
+        self._add_paragraph(doc, contact1, text_lines, style='ATS Contact')
 
         # Header - Contact Line 2
         contact2 = header['LINKEDIN']
         if header['GITHUB']:
             contact2 += f" | {header['GITHUB']}"
-        contact2_para = doc.add_paragraph(contact2)
-        if contact2_para.runs:
-            contact2_para.runs[0].font.size = Pt(10)
+        self._add_paragraph(doc, contact2, text_lines, style='ATS Contact')
 
         # Date
-        doc.add_paragraph()
-        date_para = doc.add_paragraph(header['DATE'])
-        if date_para.runs:
-            date_para.runs[0].font.size = Pt(11)
+        self._add_paragraph(doc, header['DATE'], text_lines, style='ATS Body', space_before=BLOCK_GAP)
 
         # Recipient (if not Unknown)
-        doc.add_paragraph()
         if job.company != "Unknown":
-            recipient_para = doc.add_paragraph(f"Hiring Manager\n{job.company}")
-            if recipient_para.runs:
-                for run in recipient_para.runs:
-                    run.font.size = Pt(11)
+            self._add_paragraph(doc, f"Hiring Manager\n{job.company}", text_lines, style='ATS Body',
+                                space_before=BLOCK_GAP)
 
         # Salutation
-        doc.add_paragraph()
         salutation = "Dear Hiring Manager," if job.company != "Unknown" else "Dear Hiring Team,"
-        salutation_para = doc.add_paragraph(salutation)
-        if salutation_para.runs:
-            salutation_para.runs[0].font.size = Pt(11)
+        self._add_paragraph(doc, salutation, text_lines, style='ATS Body', space_before=BLOCK_GAP)
 
         # Opening paragraph
-        doc.add_paragraph()
-        opening_para = doc.add_paragraph(opening)
-        if opening_para.runs:
-            for run in opening_para.runs:
-                run.font.size = Pt(11)
+        self._add_paragraph(doc, opening, text_lines, style='ATS Body', space_before=BLOCK_GAP)
 
         # Achievements paragraph
-        doc.add_paragraph()
-        achievements_para = doc.add_paragraph(achievements)
-        if achievements_para.runs:
-            for run in achievements_para.runs:
-                run.font.size = Pt(11)
+        self._add_paragraph(doc, achievements, text_lines, style='ATS Body', space_before=BLOCK_GAP)
 
         # Closing paragraph
-        doc.add_paragraph()
-        closing_para = doc.add_paragraph(closing)
-        if closing_para.runs:
-            for run in closing_para.runs:
-                run.font.size = Pt(11)
+        self._add_paragraph(doc, closing, text_lines, style='ATS Body', space_before=BLOCK_GAP)
 
         # Sign-off
-        doc.add_paragraph()
-        doc.add_paragraph("Best regards,")
-        doc.add_paragraph(header['NAME'])
+        self._add_paragraph(doc, "Best regards,", text_lines, space_before=BLOCK_GAP)
+        self._add_paragraph(doc, header['NAME'], text_lines)
 
-        return doc
+        return doc, "\n".join(text_lines)
@@ -3,28 +3,64 @@ CV Template Builder
 Generates CV content using modular template approach with focused LLM prompts
 """
 
-import logging
+import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from docx import Document
-from docx.shared import Pt, Inches
+from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
+from modules.generation.base_template_builder import BaseTemplateBuilder, BLOCK_GAP
 from modules.generation.ollama_client import OllamaClient
 from templates.cv_template_structure import get_cv_template, get_section_order
 
-
-class CVTemplateBuilder:
+# Validation patterns, compiled once. Each entry keeps its source pattern for issue messages.
+_SECTION_PLACEHOLDERS = tuple(
+    (pattern, re.compile(pattern, re.IGNORECASE))
+    for pattern in (r'\[.*?\]', r'\{\{.*?\}\}', 'TBD', 'N/A', 'not provided')
+)
+_BULLET_PLACEHOLDERS = tuple(
+    (pattern, re.compile(pattern))
+    for pattern in (r'\[.*?\]', r'\{\{.*?\}\}')
+)
+_SECTION_META_PHRASES = ('here is', 'here are', 'i have generated', 'i have created')
+_BULLET_META_PHRASES = ('here is', 'here are', 'bullet point')
+_SECTION_CLICHES = ('leveraged', 'spearheaded', 'passion for', 'team player', 'cutting-edge', 'fast-paced')
+_BULLET_CLICHES = ('leveraged', 'spearheaded', 'passion for', 'cutting-edge')
+
+
+class CVTemplateBuilder(BaseTemplateBuilder):
     """Builds CVs using template approach - LLM generates content, Python handles formatting"""
 
-    def __init__(self, ollama_client: OllamaClient, user_info: dict, prompts_dir: Path):
-        self.ollama = ollama_client
-        self.user_info = user_info
-        self.prompts_dir = prompts_dir
-        self.logger = logging.getLogger(__name__)
-        self.max_retries = 3
+    PROMPT_SUBDIR = 'cv_sections'
+    SECTION_PROMPTS = ('professional_summary.txt', 'project_bullets.txt')
+
+    STYLES = {
+        'ATS Name': (Pt(16), True, WD_ALIGN_PARAGRAPH.CENTER),
+        'ATS Contact': (Pt(10), False, WD_ALIGN_PARAGRAPH.CENTER),
+        'ATS Header': (Pt(12), True, None),
+        'ATS Title': (Pt(11), True, None),
+        'ATS Body': (Pt(11), False, None),
+    }
+    MARGINS = (0.5, 0.5, 0.7, 0.7)
+
+    def __init__(self, ollama_client: OllamaClient, user_info: dict, prompts_dir: Path,
+                 early_abort: bool = False):
+        super().__init__(ollama_client, user_info, prompts_dir)
+        # Stream generations and stop as soon as output is certain to fail validation
+        self.early_abort = early_abort
+
+        # Candidate blocks are identical for every job - build once so prompts share
+        # a byte-identical prefix (lets Ollama reuse its prompt cache)
+        self._user_info_text = f"""
+Name: {self.user_info.get('name', '')}
+Education: {self.user_info.get('current_education', '')}
+Skills: {', '.join(self.user_info.get('skills', [])[:15])}
+Experience: {self.user_info.get('experience_summary', 'Recent graduate')}
+        """.strip()
+        self._all_skills = ', '.join(self.user_info.get('skills', []))
 
-    def generate_cv(self, job, matched_projects: List[Dict]) -> Optional[Document]:
+    def generate_cv(self, job, matched_projects: List[Dict]) -> Optional[Tuple[Document, str]]:
         """
         Generate CV using template approach.
 
@@ -33,7 +69,7 @@ class CVTemplateBuilder:
             matched_projects: List of 3 matched projects with metadata
 
         Returns:
-            Document object or None if generation fails
+            Tuple of (Document, plain text) or None if generation fails
         """
         self.logger.info("Generating CV using template approach...")
 
@@ -50,10 +86,8 @@ class CVTemplateBuilder:
         # Step 3: Merge all content
         all_content = {**static_content, **dynamic_content}
 
-        # Step 4: Fill template and create Word document
-        cv_doc = self._create_word_document(all_content)
-
-        return cv_doc
+        # Step 4: Fill template and create Word document (text collected alongside)
+        return self._create_word_document(all_content)
 
     def _prepare_static_content(self, matched_projects: List[Dict]) -> Dict[str, str]:
         """Prepare content that doesn't need LLM generation"""
@@ -143,21 +177,17 @@ RCCG Department of Public Health | January 2024 – November 2024
     def _generate_section(self, section_name: str, prompt_file: str, job, matched_projects: List[Dict]) -> Optional[str]:
         """Generate a single section with retry logic"""
 
+        # Prompt is identical across attempts - build it once
+        try:
+            prompt = self._build_prompt(prompt_file, self._prepare_context(job, matched_projects))
+        except Exception as e:
+            self.logger.error(f"Error preparing {section_name} prompt: {e}")
+            return None
+
         for attempt in range(1, self.max_retries + 1):
             try:
                 self.logger.info(f"Generating {section_name} (attempt {attempt}/{self.max_retries})")
 
-                # Load prompt template
-                prompt_path = self.prompts_dir / 'cv_sections' / prompt_file
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    prompt_template = f.read()
-
-                # Prepare context
-                context = self._prepare_context(job, matched_projects)
-
-                # Fill prompt
-                prompt = prompt_template.format(**context)
-
                 # Generate with focused parameters
                 temperature = 0.3 if attempt == 1 else 0.2  # Lower temp on retry
                 max_tokens = 300 if section_name == 'professional_summary' else 200
@@ -165,7 +195,11 @@ RCCG Department of Public Health | January 2024 – November 2024
                 content = self.ollama.generate_text(
                     prompt=prompt,
                     temperature=temperature,
-                    max_tokens=max_tokens
+                    max_tokens=max_tokens,
+                    should_abort=self._section_abort_check if self.early_abort else None,
+                    # Retries need a fresh sample; only valid output is cached
+                    cache=attempt == 1,
+                    accept=lambda text: self._validate_section(text, section_name)[0]
                 )
 
                 if not content:
@@ -190,33 +224,33 @@ RCCG Department of Public Health | January 2024 – November 2024
     def _generate_project_bullets(self, job, project: Dict, project_num: int) -> Optional[str]:
         """Generate bullet points for a single project"""
 
+        # Prompt is identical across attempts - build it once
+        context = {
+            'job_description': job.description[:1000],
+            'project_title': project['title'],
+            'project_technologies': ", ".join(project['technologies']),
+            'project_description': project['description'],
+            'relevance_context': project.get('relevance_context', '')
+        }
+        try:
+            prompt = self._build_prompt('project_bullets.txt', context)
+        except Exception as e:
+            self.logger.error(f"Error preparing project {project_num} prompt: {e}")
+            return None
+
         for attempt in range(1, self.max_retries + 1):
             try:
                 self.logger.info(f"Generating project {project_num} bullets (attempt {attempt}/{self.max_retries})")
 
-                # Load prompt
-                prompt_path = self.prompts_dir / 'cv_sections' / 'project_bullets.txt'
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    prompt_template = f.read()
-
-                # Prepare context
-                context = {
-                    'job_description': job.description[:1000],
-                    'project_title': project['title'],
-                    'project_technologies': ", ".join(project['technologies']),
-                    'project_description': project['description'],
-                    'relevance_context': project.get('relevance_context', '')
-                }
-
-                # Fill prompt
-                prompt = prompt_template.format(**context)
-
                 # Generate
                 temperature = 0.4 if attempt == 1 else 0.3
                 bullets = self.ollama.generate_text(
                     prompt=prompt,
                     temperature=temperature,
-                    max_tokens=250
+                    max_tokens=250,
+                    should_abort=self._bullets_abort_check if self.early_abort else None,
+                    cache=attempt == 1,
+                    accept=lambda text: self._validate_bullets(text)[0]
                 )
 
                 if not bullets:
@@ -240,30 +274,37 @@ RCCG Department of Public Health | January 2024 – November 2024
     def _prepare_context(self, job, matched_projects: List[Dict]) -> Dict[str, str]:
         """Prepare context for prompt templates"""
 
-        # User info summary
-        user_info_text = f"""
-Name: {self.user_info.get('name', '')}
-Education: {self.user_info.get('current_education', '')}
-Skills: {', '.join(self.user_info.get('skills', [])[:15])}
-Experience: {self.user_info.get('experience_summary', 'Recent graduate')}
-        """.strip()
-
         # Projects summary
-        projects_summary = "\n".join([
+        projects_summary = "\n".join(
             f"- {p['title']} (Relevance: {p.get('score', 0)}/10): {p['description'][:150]}"
             for p in matched_projects[:3]
-        ])
-
-        # All skills
-        all_skills = ', '.join(self.user_info.get('skills', []))
+        )
 
         return {
             'job_description': job.description[:1500],
-            'user_info': user_info_text,
+            'user_info': self._user_info_text,
             'projects_summary': projects_summary,
-            'all_skills': all_skills
+            'all_skills': self._all_skills
         }
 
+    def _section_abort_check(self, partial: str) -> bool:
+        """True once partial section output already contains something validation rejects"""
+        partial_lower = partial.lower()
+        return (
+            any(phrase in partial_lower for phrase in _SECTION_META_PHRASES)
+            or any(regex.search(partial) for _, regex in _SECTION_PLACEHOLDERS)
+            or any(c in partial_lower for c in _SECTION_CLICHES)
+        )
+
+    def _bullets_abort_check(self, partial: str) -> bool:
+        """True once partial bullet output already contains something validation rejects"""
+        partial_lower = partial.lower()
+        return (
+            any(phrase in partial_lower for phrase in _BULLET_META_PHRASES)
+            or any(regex.search(partial) for _, regex in _BULLET_PLACEHOLDERS)
+            or any(c in partial_lower for c in _BULLET_CLICHES)
+        )
+
     def _validate_section(self, content: str, section_name: str) -> Tuple[bool, List[str]]:
         """Validate generated section content"""
         issues = []
@@ -272,20 +313,16 @@ Experience: {self.user_info.get('experience_summary', 'Recent graduate')}
         content_lower = content.lower()
 
         # Check for meta-commentary
-        meta_phrases = ['here is', 'here are', 'i have generated', 'i have created']
-        if any(phrase in content_lower for phrase in meta_phrases):
+        if any(phrase in content_lower for phrase in _SECTION_META_PHRASES):
             issues.append("Contains meta-commentary")
 
         # Check for placeholders
-        placeholder_patterns = [r'\[.*?\]', r'\{\{.*?\}\}', 'TBD', 'N/A', 'not provided']
-        import re
-        for pattern in placeholder_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        for pattern, regex in _SECTION_PLACEHOLDERS:
+            if regex.search(content):
                 issues.append(f"Contains placeholder: {pattern}")
 
         # Check for AI clichés
-        cliches = ['leveraged', 'spearheaded', 'passion for', 'team player', 'cutting-edge', 'fast-paced']
-        found_cliches = [c for c in cliches if c in content_lower]
+        found_cliches = [c for c in _SECTION_CLICHES if c in content_lower]
         if found_cliches:
             issues.append(f"Contains clichés: {', '.join(found_cliches)}")
 
@@ -316,73 +353,51 @@ Experience: {self.user_info.get('experience_summary', 'Recent graduate')}
             issues.append("Must have at most 3 bullet points")
 
         # Check for placeholders
-        import re
-        placeholder_patterns = [r'\[.*?\]', r'\{\{.*?\}\}']
-        for pattern in placeholder_patterns:
-            if re.search(pattern, bullets):
+        for pattern, regex in _BULLET_PLACEHOLDERS:
+            if regex.search(bullets):
                 issues.append(f"Contains placeholder: {pattern}")
 
         # Check for clichés
         bullets_lower = bullets.lower()
-        cliches = ['leveraged', 'spearheaded', 'passion for', 'cutting-edge']
-        found_cliches = [c for c in cliches if c in bullets_lower]
+        found_cliches = [c for c in _BULLET_CLICHES if c in bullets_lower]
         if found_cliches:
             issues.append(f"Contains clichés: {', '.join(found_cliches)}")
 
         # Check for meta-commentary
-        if any(phrase in bullets_lower for phrase in ['here is', 'here are', 'bullet point']):
+        if any(phrase in bullets_lower for phrase in _BULLET_META_PHRASES):
             issues.append("Contains meta-commentary")
 
         return len(issues) == 0, issues
 
-    def _create_word_document(self, content: Dict[str, str]) -> Document:
-        """Create formatted Word document from content"""
-        doc = Document()
-
-        # Set margins
-        sections = doc.sections
-        for section in sections:
-            section.top_margin = Inches(0.5)
-            section.bottom_margin = Inches(0.5)
-            section.left_margin = Inches(0.7)
-            section.right_margin = Inches(0.7)
+    def _create_word_document(self, content: Dict[str, str]) -> Tuple[Document, str]:
+        """Create formatted Word document from content, returning it with its plain text"""
+        doc = self._new_document()
+        text_lines: List[str] = []
 
         # Name (16pt, bold, centered)
-        name_para = doc.add_paragraph(content.get('NAME', 'Unknown'))
-        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        if name_para.runs:
-            name_run = name_para.runs[0]
-            name_run.font.size = Pt(16)
-            name_run.bold = True
+        self._add_paragraph(doc, content.get('NAME', 'Unknown'), text_lines, style='ATS Name')
 
         # Contact info - Line 1: Location | Phone | Email (10pt, centered)
         contact_line1 = f"{content.get('LOCATION', '')} | {content.get('PHONE', '')} | {content.get('EMAIL', '')}"
-        contact_para1 = doc.add_paragraph(contact_line1)
-        contact_para1.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        if contact_para1.runs:
-            contact_para1.runs[0].font.size = Pt(10)
+        self._add_paragraph(doc, contact_line1, text_lines, style='ATS Contact')
 
         # Contact info - Line 2: LinkedIn | GitHub (10pt, centered)
         github = self.user_info.get('github', '')
         contact_line2 = f"{content.get('LINKEDIN', '')}"
         if github:
             contact_line2 += f" | {github}"
-        contact_para2 = doc.add_paragraph(contact_line2)
-        contact_para2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        if contact_para2.runs:
-            contact_para2.runs[0].font.size = Pt(10)
+        self._add_paragraph(doc, contact_line2, text_lines, style='ATS Contact')
 
         # Professional Summary
-        self._add_section(doc, "PROFESSIONAL SUMMARY", content['PROFESSIONAL_SUMMARY'])
+        self._add_section(doc, "PROFESSIONAL SUMMARY", content['PROFESSIONAL_SUMMARY'], text_lines)
 
         # Technical Skills
-        self._add_section(doc, "TECHNICAL SKILLS", content['SKILLS_CATEGORIZED'])
+        self._add_section(doc, "TECHNICAL SKILLS", content['SKILLS_CATEGORIZED'], text_lines,
+                          space_before=BLOCK_GAP)
 
         # Key Projects
-        header_para = doc.add_paragraph("KEY PROJECTS")
-        if header_para.runs:
-            header_para.runs[0].font.size = Pt(12)
-            header_para.runs[0].bold = True
+        self._add_paragraph(doc, "KEY PROJECTS", text_lines, style='ATS Header',
+                            space_before=BLOCK_GAP)
 
         # Only iterate over projects that actually exist in content
         num_projects = sum(1 for i in range(1, 4) if f'PROJECT_{i}_TITLE' in content and content[f'PROJECT_{i}_TITLE'])
@@ -393,64 +408,47 @@ Experience: {self.user_info.get('experience_summary', 'Recent graduate')}
             if not title:
                 continue
 
-            title_para = doc.add_paragraph(title)
-            if title_para.runs:
-                title_para.runs[0].font.size = Pt(11)
-                title_para.runs[0].bold = True
+            # Gap between projects (none directly under the header)
+            self._add_paragraph(doc, title, text_lines, style='ATS Title',
+                                space_before=BLOCK_GAP if i > 1 else None)
 
             # Technologies
             tech = content.get(f'PROJECT_{i}_TECH', '')
-            tech_para = doc.add_paragraph(f"Technologies: {tech}")
-            if tech_para.runs:
-                tech_para.runs[0].font.size = Pt(11)
+            self._add_paragraph(doc, f"Technologies: {tech}", text_lines, style='ATS Body')
 
             # Bullets
             bullets = content.get(f'PROJECT_{i}_BULLETS', '')
             for bullet_line in bullets.split('\n'):
                 if bullet_line.strip():
-                    bullet_para = doc.add_paragraph(bullet_line.strip())
-                    if bullet_para.runs:
-                        bullet_para.runs[0].font.size = Pt(11)
-
-            # Spacing
-            doc.add_paragraph()
+                    self._add_paragraph(doc, bullet_line.strip(), text_lines, style='ATS Body')
 
         # Professional Experience (before Education)
-        self._add_section(doc, "PROFESSIONAL EXPERIENCE", content['PROFESSIONAL_EXPERIENCE'])
+        self._add_section(doc, "PROFESSIONAL EXPERIENCE", content['PROFESSIONAL_EXPERIENCE'], text_lines,
+                          space_before=BLOCK_GAP)
 
         # Education
-        self._add_section(doc, "EDUCATION", content['EDUCATION'])
+        self._add_section(doc, "EDUCATION", content['EDUCATION'], text_lines,
+                          space_before=BLOCK_GAP)
 
         # Certifications (if any)
         if content.get('CERTIFICATIONS'):
             cert_lines = content['CERTIFICATIONS'].split('\n')
             if cert_lines and cert_lines[0]:
-                cert_header = doc.add_paragraph(cert_lines[0])
-                if cert_header.runs:
-                    cert_header.runs[0].font.size = Pt(12)
-                    cert_header.runs[0].bold = True
+                self._add_paragraph(doc, cert_lines[0], text_lines, style='ATS Header',
+                                    space_before=BLOCK_GAP)
             for cert_line in cert_lines[1:]:
                 if cert_line.strip():
-                    cert_para = doc.add_paragraph(cert_line.strip())
-                    if cert_para.runs:
-                        cert_para.runs[0].font.size = Pt(11)
+                    self._add_paragraph(doc, cert_line.strip(), text_lines, style='ATS Body')
 
-        return doc
+        return doc, "\n".join(text_lines)
 
-    def _add_section(self, doc: Document, header: str, content: str):
+    def _add_section(self, doc: Document, header: str, content: str, text_lines: List[str],
+                     space_before: Optional[Pt] = None):
         """Add a section with header and content"""
         # Header (12pt, bold)
-        header_para = doc.add_paragraph(header)
-        if header_para.runs:
-            header_para.runs[0].font.size = Pt(12)
-            header_para.runs[0].bold = True
+        self._add_paragraph(doc, header, text_lines, style='ATS Header', space_before=space_before)
 
         # Content (11pt)
         for line in content.split('\n'):
             if line.strip():
-                para = doc.add_paragraph(line.strip())
-                if para.runs:
-                    para.runs[0].font.size = Pt(11)
-
-        # Spacing
-        doc.add_paragraph()
+                self._add_paragraph(doc, line.strip(), text_lines, style='ATS Body')
@@ -5,12 +5,11 @@ Generates ATS-optimized CVs and cover letters for job applications.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime
-from docx import Document
-from docx.shared import Pt, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 from modules.generation.ollama_client import get_ollama_client
 from modules.generation.project_matcher import get_project_matcher
@@ -23,10 +22,84 @@ from modules.utils.cv_validator import CVValidator
 from modules.utils.cv_fixer import get_cv_fixer
 from modules.utils.company_researcher import get_company_researcher
 
+# Separator line for log banners
+_BANNER = "=" * 60
+
+
+def _parse_technologies(project: Dict[str, Any], value: str) -> None:
+    """Technologies: tech1, tech2, tech3"""
+    project['technologies'] = [t.strip() for t in value.split(',') if t.strip()]
+
+
+def _parse_key_results(project: Dict[str, Any], value: str) -> None:
+    """Key Results: metrics (appended to description for context)"""
+    key_results = value.strip()
+    if key_results:
+        project['description'] += f" Key metrics: {key_results}"
+
+
+# Prefix (text before the first ':') -> handler for project detail lines
+_PREFIX_HANDLERS = {
+    'Technologies': _parse_technologies,
+    'Key Results': _parse_key_results,
+}
+
+
+@lru_cache(maxsize=256)
+def _correction_prompt(critical_issues: Tuple[str, ...]) -> str:
+    """Map validation issues to correction instructions (deterministic, so cached)"""
+    corrections = []
+    corrections.append("CRITICAL CORRECTIONS NEEDED:")
+    corrections.append("")
+
+    for issue in critical_issues:
+        if "meta-commentary" in issue.lower():
+            corrections.append("• START IMMEDIATELY with the candidate's name. NO introductory text like 'Here is...'")
+        elif "relevance score" in issue.lower():
+            corrections.append("• REMOVE all relevance scores (X/10) from the output. They should not appear in the CV.")
+        elif "placeholder" in issue.lower():
+            corrections.append("• REMOVE all placeholder text [like this], TBD, N/A. Use only complete information.")
+        elif "missing" in issue.lower() and "section" in issue.lower():
+            corrections.append(f"• INCLUDE the missing section: {issue}")
+        elif "contact" in issue.lower():
+            corrections.append("• ENSURE contact information (email, phone) is included after the name")
+        elif "date" in issue.lower():
+            corrections.append(f"• FIX date mismatch: {issue}. Use ONLY dates from provided user info.")
+        elif "project" in issue.lower():
+            corrections.append("• INCLUDE ALL 3 projects. Each needs 2-3 bullet points.")
+        else:
+            corrections.append(f"• {issue}")
+
+    corrections.append("")
+    corrections.append("Regenerate the CV fixing these specific issues.")
+
+    return "\n".join(corrections)
+
+
+def _bucket_jobs(
+    jobs: List[JobPosting], bucket_size: int
+) -> List[List[Tuple[int, JobPosting]]]:
+    """
+    Group jobs of similar description length, keeping their original positions
+
+    Args:
+        jobs: Job postings
+        bucket_size: Jobs per bucket (the number processed at once)
+
+    Returns:
+        Buckets of (original_index, job) pairs, shortest descriptions first
+    """
+    ordered = sorted(enumerate(jobs), key=lambda item: len((item[1].description or "")[:2000]))
+    size = max(1, bucket_size)
+    return [ordered[i:i + size] for i in range(0, len(ordered), size)]
+
 
 class MaterialGenerator:
     """Generates CVs and cover letters"""
 
+    # Output directories already created in this process
+    _dirs_created: Set[Path] = set()
+
     def __init__(
         self,
         user_info: Dict[str, Any],
@@ -48,18 +121,48 @@ class MaterialGenerator:
         self.fixer = get_cv_fixer()
         self.company_researcher = get_company_researcher()
 
+        # Formatted user info block (user_info doesn't change per generator)
+        self._user_info_str: Optional[str] = None
+
+        # Parsed project details keyed by project_id (shared by CV + cover letter)
+        self._parsed_projects: Dict[str, Optional[Dict[str, Any]]] = {}
+
         # Initialize template builders (modular approach)
         prompts_dir = Path("prompts")
-        self.cv_builder = CVTemplateBuilder(self.ollama, user_info, prompts_dir)
+        early_abort = os.getenv("CV_EARLY_ABORT", "false").lower() == "true"
+        self.cv_builder = CVTemplateBuilder(self.ollama, user_info, prompts_dir, early_abort=early_abort)
         self.cl_builder = CoverLetterTemplateBuilder(self.ollama, user_info, prompts_dir)
 
-        # Create output directories
-        (self.output_dir / "cvs").mkdir(parents=True, exist_ok=True)
-        (self.output_dir / "cover_letters").mkdir(parents=True, exist_ok=True)
-        (self.output_dir / "failed_cvs").mkdir(parents=True, exist_ok=True)
+        # Create output directories (once per output_dir per process)
+        if self.output_dir not in MaterialGenerator._dirs_created:
+            (self.output_dir / "cvs").mkdir(parents=True, exist_ok=True)
+            (self.output_dir / "cover_letters").mkdir(parents=True, exist_ok=True)
+            (self.output_dir / "failed_cvs").mkdir(parents=True, exist_ok=True)
+            MaterialGenerator._dirs_created.add(self.output_dir)
+
+    def warmup(self) -> bool:
+        """
+        Load the text model into memory ahead of the first real generation
+
+        Returns:
+            True if the model responded, False otherwise
+        """
+        self.logger.info(f"Warming up model: {self.ollama.text_model}")
+        result = self.ollama.generate_text("ok", temperature=0.0, max_tokens=1, cache=False)
+        if result is None:
+            self.logger.warning("Model warmup failed")
+            return False
+        self.logger.info("✓ Model warmed up")
+        return True
 
     def format_user_info(self) -> str:
-        """Format user information with proper defaults"""
+        """Format user information with proper defaults (built once per generator)"""
+        if self._user_info_str is None:
+            self._user_info_str = self._format_user_info_impl()
+        return self._user_info_str
+
+    def _format_user_info_impl(self) -> str:
+        """Build the formatted user information block"""
 
         # Handle missing graduation date
         grad_date = self.user_info.get('graduation_date')
@@ -99,32 +202,7 @@ IMPORTANT: Any field marked [OMIT - not provided] should be completely excluded
 
     def _build_correction_prompt(self, validation_result: Dict[str, Any]) -> str:
         """Build specific correction instructions based on validation issues"""
-        corrections = []
-        corrections.append("CRITICAL CORRECTIONS NEEDED:")
-        corrections.append("")
-
-        for issue in validation_result["critical_issues"]:
-            if "meta-commentary" in issue.lower():
-                corrections.append("• START IMMEDIATELY with the candidate's name. NO introductory text like 'Here is...'")
-            elif "relevance score" in issue.lower():
-                corrections.append("• REMOVE all relevance scores (X/10) from the output. They should not appear in the CV.")
-            elif "placeholder" in issue.lower():
-                corrections.append("• REMOVE all placeholder text [like this], TBD, N/A. Use only complete information.")
-            elif "missing" in issue.lower() and "section" in issue.lower():
-                corrections.append(f"• INCLUDE the missing section: {issue}")
-            elif "contact" in issue.lower():
-                corrections.append("• ENSURE contact information (email, phone) is included after the name")
-            elif "date" in issue.lower():
-                corrections.append(f"• FIX date mismatch: {issue}. Use ONLY dates from provided user info.")
-            elif "project" in issue.lower():
-                corrections.append("• INCLUDE ALL 3 projects. Each needs 2-3 bullet points.")
-            else:
-                corrections.append(f"• {issue}")
-
-        corrections.append("")
-        corrections.append("Regenerate the CV fixing these specific issues.")
-
-        return "\n".join(corrections)
+        return _correction_prompt(tuple(validation_result["critical_issues"]))
 
     def generate_cv(
         self, job: JobPosting, matched_projects: Dict[str, Any]
@@ -142,21 +220,14 @@ IMPORTANT: Any field marked [OMIT - not provided] should be completely excluded
         self.logger.info(f"Generating CV for {job.company} - {job.title}")
 
         # Format matched projects for template builder
-        project_scores = matched_projects.get("project_scores", [])[:3]
         formatted_projects = []
 
-        for score_data in project_scores:
+        for score_data, project_data in self._fetch_matched_projects(matched_projects):
             project_id = score_data.get("project_id")
-            project_name = score_data.get("project_name", "Unknown")
             relevance_score = score_data.get("score", 0)
             reasoning = score_data.get("reasoning", "")
 
-            # Get full project details
-            details = self.project_matcher.get_project_details(project_id)
-            if details:
-                # Parse project details (extract title, description, technologies)
-                project_data = self._parse_project_details(details)
-
+            if project_data:
                 # Validate that we got all required fields
                 if not project_data.get('title'):
                     self.logger.warning(f"Project {project_id} has no title, skipping")
@@ -178,12 +249,14 @@ IMPORTANT: Any field marked [OMIT - not provided] should be completely excluded
 
         # Generate CV using template builder (handles validation internally)
         try:
-            cv_doc = self.cv_builder.generate_cv(job, formatted_projects)
+            cv_built = self.cv_builder.generate_cv(job, formatted_projects)
 
-            if not cv_doc:
+            if not cv_built:
                 self.logger.error("CV generation failed - template builder returned None")
                 return None
 
+            cv_doc, cv_text = cv_built
+
             # Save as .docx
             safe_company = sanitize_filename(job.company)
             filename = f"{self.user_info['name'].replace(' ', '_')}_CV_{safe_company}_ATS"
@@ -202,9 +275,6 @@ IMPORTANT: Any field marked [OMIT - not provided] should be completely excluded
                 "warnings": []
             }
 
-            # Extract text from document for return value
-            cv_text = "\n".join([para.text for para in cv_doc.paragraphs if para.text.strip()])
-
             return (cv_text, str(cv_path), validation_result)
 
         except Exception as e:
@@ -213,6 +283,46 @@ IMPORTANT: Any field marked [OMIT - not provided] should be completely excluded
             self.logger.error(traceback.format_exc())
             return None
 
+    def _fetch_matched_projects(
+        self, matched_projects: Dict[str, Any]
+    ) -> List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """
+        Fetch parsed details for the top 3 matched projects in one pass
+
+        Args:
+            matched_projects: Matched projects from project matcher
+
+        Returns:
+            List of (score_data, parsed project copy or None)
+        """
+        return [
+            (score_data, self._get_parsed_project(score_data.get("project_id")))
+            for score_data in matched_projects.get("project_scores", [])[:3]
+        ]
+
+    def _get_parsed_project(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and parse project details, caching the result per project
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Fresh copy of the parsed project dict, or None if not found
+        """
+        if project_id not in self._parsed_projects:
+            details = self.project_matcher.get_project_details(project_id)
+            self._parsed_projects[project_id] = (
+                self._parse_project_details(details) if details else None
+            )
+
+        project = self._parsed_projects[project_id]
+        if project is None:
+            return None
+
+        # Callers annotate the dict with per-job scores, so hand out a copy
+        return {**project, 'technologies': list(project['technologies'])}
+
     def _parse_project_details(self, details_text: str) -> Dict[str, Any]:
         """
         Parse project details text into structured format.
@@ -223,7 +333,7 @@ IMPORTANT: Any field marked [OMIT - not provided] should be completely excluded
         Line 3: Technologies: tech1, tech2, tech3
         Line 4: Key Results: metrics
         """
-        lines = [line.strip() for line in details_text.strip().split('\n') if line.strip()]
+        lines = [line for line in map(str.strip, details_text.splitlines()) if line]
 
         project = {
             'title': '',
@@ -242,14 +352,10 @@ IMPORTANT: Any field marked [OMIT - not provided] should be completely excluded
 
         # Lines 3+: Look for Technologies and Key Results
         for line in lines[2:]:
-            if line.startswith('Technologies:'):
-                tech_line = line.replace('Technologies:', '').strip()
-                project['technologies'] = [t.strip() for t in tech_line.split(',') if t.strip()]
-            elif line.startswith('Key Results:'):
-                # Append key results to description for context
-                key_results = line.replace('Key Results:', '').strip()
-                if key_results:
-                    project['description'] += f" Key metrics: {key_results}"
+            key, sep, value = line.partition(':')
+            handler = _PREFIX_HANDLERS.get(key) if sep else None
+            if handler:
+                handler(project, value)
 
         # Log parsed project for debugging
         self.logger.debug(f"Parsed project: title='{project['title']}', "
@@ -259,7 +365,10 @@ IMPORTANT: Any field marked [OMIT - not provided] should be completely excluded
         return project
 
     def generate_cover_letter(
-        self, job: JobPosting, matched_projects: Dict[str, Any]
+        self,
+        job: JobPosting,
+        matched_projects: Dict[str, Any],
+        company_research: Optional[Dict[str, str]] = None,
     ) -> Optional[Tuple[str, str]]:
         """
         Generate cover letter using template approach with company research
@@ -267,40 +376,39 @@ IMPORTANT: Any field marked [OMIT - not provided] should be completely excluded
         Args:
             job: Job posting
             matched_projects: Matched projects from project matcher
+            company_research: Pre-fetched company research (fetched here if None)
 
         Returns:
             Tuple of (cover_letter_text, file_path) or None if failed
         """
         self.logger.info(f"Generating cover letter for {job.company} - {job.title}")
 
-        # Step 1: Research company (web search)
-        company_research = self.company_researcher.research_company(job.company, job.title)
+        # Step 1: Research company (web search) unless already fetched
+        if company_research is None:
+            company_research = self.company_researcher.research_company(job.company, job.title)
 
         # Step 2: Format matched projects for cover letter builder
-        project_scores = matched_projects.get("project_scores", [])[:3]
         formatted_projects = []
 
-        for score_data in project_scores:
-            project_id = score_data.get("project_id")
-            details = self.project_matcher.get_project_details(project_id)
-            if details:
-                project_data = self._parse_project_details(details)
-                if project_data.get('title'):
-                    project_data["score"] = score_data.get("score", 0)
-                    project_data["relevance_context"] = score_data.get("reasoning", "")
-                    formatted_projects.append(project_data)
+        for score_data, project_data in self._fetch_matched_projects(matched_projects):
+            if project_data and project_data.get('title'):
+                project_data["score"] = score_data.get("score", 0)
+                project_data["relevance_context"] = score_data.get("reasoning", "")
+                formatted_projects.append(project_data)
 
         if len(formatted_projects) < 1:
             self.logger.warning("No valid projects for cover letter, using fallback")
 
         # Step 3: Generate cover letter using template builder
         try:
-            cl_doc = self.cl_builder.generate_cover_letter(job, company_research, formatted_projects)
+            cl_built = self.cl_builder.generate_cover_letter(job, company_research, formatted_projects)
 
-            if not cl_doc:
+            if not cl_built:
                 self.logger.error("Cover letter generation failed - template builder returned None")
                 return None
 
+            cl_doc, cl_text = cl_built
+
             # Save as .docx
             safe_company = sanitize_filename(job.company)
             filename = f"{self.user_info['name'].replace(' ', '_')}_CoverLetter_{safe_company}"
@@ -310,9 +418,6 @@ IMPORTANT: Any field marked [OMIT - not provided] should be completely excluded
 
             self.logger.info(f"✓ Cover letter saved: {cl_path}")
 
-            # Extract text from document for return value
-            cl_text = "\n".join([para.text for para in cl_doc.paragraphs if para.text.strip()])
-
             return (cl_text, str(cl_path))
 
         except Exception as e:
@@ -322,34 +427,56 @@ IMPORTANT: Any field marked [OMIT - not provided] should be completely excluded
             return None
 
     def generate_materials(
-        self, job: JobPosting
+        self,
+        job: JobPosting,
+        matched_projects: Optional[Dict[str, Any]] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Generate all materials for a job application
 
         Args:
             job: Job posting
+            matched_projects: Precomputed match result (e.g. from match_projects_batch);
+                projects are matched here when omitted
 
         Returns:
             Dictionary containing generated materials and metadata
         """
-        self.logger.info("=" * 60)
+        self.logger.info(_BANNER)
         self.logger.info(f"Generating materials for: {job.company} - {job.title}")
-        self.logger.info("=" * 60)
-
-        # Step 1: Match projects
-        matched_projects = self.project_matcher.match_projects(job)
+        self.logger.info(_BANNER)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Start company research (web search) in the background right away
+            research_future = executor.submit(
+                self.company_researcher.research_company, job.company, job.title
+            )
+
+            # Step 1: Match projects (overlaps with company research)
+            if matched_projects is None:
+                matched_projects = self.project_matcher.match_projects(job)
+
+            # Parse matched project details once, before both workers need them
+            self._fetch_matched_projects(matched_projects)
+
+            # Step 2 + 3: Generate CV and cover letter concurrently
+            cv_future = executor.submit(self.generate_cv, job, matched_projects)
+            cl_future = executor.submit(
+                lambda: self.generate_cover_letter(
+                    job,
+                    matched_projects,
+                    company_research=research_future.result(),
+                )
+            )
+            cv_result = cv_future.result()
+            cl_result = cl_future.result()
 
-        # Step 2: Generate CV
-        cv_result = self.generate_cv(job, matched_projects)
         if not cv_result:
             self.logger.error("CV generation failed")
             return None
 
         cv_text, cv_path, cv_validation = cv_result
 
-        # Step 3: Generate cover letter
-        cl_result = self.generate_cover_letter(job, matched_projects)
         if not cl_result:
             self.logger.error("Cover letter generation failed")
             return None
@@ -374,6 +501,50 @@ IMPORTANT: Any field marked [OMIT - not provided] should be completely excluded
             "generated_at": datetime.now().isoformat(),
         }
 
+    def generate_materials_batch(
+        self,
+        jobs: List[JobPosting],
+        matched_projects: Optional[List[Optional[Dict[str, Any]]]] = None,
+        max_concurrent: int = 2,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Generate materials for several jobs with overlapping requests
+
+        Keeps multiple jobs in flight so Ollama always has queued work
+        (set OLLAMA_NUM_PARALLEL on the server to decode them concurrently).
+        Each job is isolated: an exception fails that job only.
+
+        Args:
+            jobs: Job postings
+            matched_projects: Precomputed match results in the same order as jobs
+                (e.g. from match_projects_batch); None entries are matched per job
+            max_concurrent: Maximum number of jobs processed at once
+
+        Returns:
+            List of results in the same order as jobs (None for failed jobs)
+        """
+        if matched_projects is None:
+            matched_projects = [None] * len(jobs)
+
+        def _generate(index: int) -> Optional[Dict[str, Any]]:
+            job = jobs[index]
+            try:
+                return self.generate_materials(job, matched_projects=matched_projects[index])
+            except Exception as e:
+                self.logger.error(f"Error generating materials for {job.company}: {e}", exc_info=True)
+                return None
+
+        # Each bucket is one wave of in-flight jobs with similar prompt lengths, so
+        # none waits on a much longer neighbour; results are put back in input order
+        max_concurrent = max(1, max_concurrent)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+            for bucket in _bucket_jobs(jobs, max_concurrent):
+                indices = [index for index, _ in bucket]
+                for index, result in zip(indices, executor.map(_generate, indices)):
+                    results[index] = result
+        return results
+
 
 def create_material_generator(user_info: Dict[str, Any]) -> MaterialGenerator:
     """
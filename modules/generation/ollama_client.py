@@ -5,14 +5,93 @@ Provides interface to local Ollama server for LLM inference.
 Supports both text generation (Llama) and vision models (LLaVA).
 """
 
+import io
 import os
+import re
 import json
+import time
+import atexit
+import hashlib
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Callable, Tuple, Iterator, BinaryIO
 from pathlib import Path
-import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    from pybase64 import b64encode  # SIMD-accelerated, byte-identical output
+except ImportError:
+    from base64 import b64encode
 
 from modules.core.logger import get_logger
+from modules.utils.helpers import json_loads
+from modules.generation.prompt_cache import PromptCache
+
+# Fallback patterns for JSON wrapped in markdown code blocks
+_JSON_PATTERNS = [
+    re.compile(pattern, re.DOTALL)
+    for pattern in (
+        r"```json\s*(\{.*?\})\s*```",  # JSON in code block
+        r"```\s*(\{.*?\})\s*```",  # Code block without language
+    )
+]
+
+
+def _find_json_span(text: str, start: int = 0) -> Optional[Tuple[int, int]]:
+    """
+    Find the next balanced {...} span in a single left-to-right pass
+
+    Tracks brace depth outside JSON strings (honouring escapes), so braces
+    inside string values don't end the span early.
+
+    Args:
+        text: Text to scan
+        start: Index to start scanning from
+
+    Returns:
+        (start, end) slice bounds of the span, or None if there is none
+    """
+    begin = text.find("{", start)
+    if begin < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(begin, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return begin, i + 1
+    return None
+
+
+# {{variable}} placeholders in prompt template files
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# Seconds a /api/tags answer is reused (startup checks run back to back)
+_TAGS_TTL = 5.0
+
+
+@lru_cache(maxsize=32)
+def _read_prompt_template(path: str, mtime: float) -> str:
+    """Read a prompt template; mtime is part of the cache key so edits are picked up"""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
 
 
 class OllamaClient:
@@ -24,6 +103,10 @@ class OllamaClient:
         text_model: str = "llama3.1:8b",
         vision_model: str = "llava:13b",
         timeout: int = 300,
+        keep_alive: str = "30m",
+        cache_path: str = "workspace/.llm_cache.db",
+        cache_max_entries: int = 10000,
+        cache_ttl: Optional[int] = None,
     ):
         """
         Initialize Ollama client
@@ -33,13 +116,67 @@ class OllamaClient:
             text_model: Model name for text generation
             vision_model: Model name for vision tasks
             timeout: Request timeout in seconds
+            keep_alive: How long Ollama keeps a model loaded after a request
+            cache_path: SQLite file for cached responses
+            cache_max_entries: Maximum cached responses kept on disk
+            cache_ttl: Seconds before a cached response expires (None = never)
         """
         self.host = host.rstrip("/")
         self.text_model = text_model
         self.vision_model = vision_model
         self.timeout = timeout
+        self.keep_alive = keep_alive
         self.logger = get_logger()
 
+        # One session for every call so the connection to Ollama is reused
+        # instead of being set up and torn down per request
+        self.session = requests.Session()
+        self.session.headers["Connection"] = "keep-alive"
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # (fetched_at, model names) from the last /api/tags request
+        self._tags_cache: Tuple[float, Optional[List[str]]] = (0.0, None)
+
+        # Exact-match response cache: identical requests skip the network entirely
+        self.cache = PromptCache(
+            path=cache_path, max_entries=cache_max_entries, ttl_seconds=cache_ttl
+        )
+
+    def close(self):
+        """Close the HTTP session, its pooled connections and the response cache"""
+        self.session.close()
+        self.cache.close()
+
+    def _get_tags(self) -> Optional[List[str]]:
+        """
+        Fetch installed model names from /api/tags, reusing a recent answer
+
+        Raises:
+            requests.exceptions.RequestException: If the server can't be reached
+
+        Returns:
+            Model names, or None if the server returned an error status
+        """
+        fetched_at, models = self._tags_cache
+        if models is not None and time.monotonic() - fetched_at < _TAGS_TTL:
+            return models
+
+        response = self.session.get(f"{self.host}/api/tags", timeout=5)
+        if response.status_code != 200:
+            self.logger.error(f"Ollama server returned status {response.status_code}")
+            return None
+
+        data = json_loads(response.content)
+        models = [model["name"] for model in data.get("models", [])]
+        self._tags_cache = (time.monotonic(), models)
+        return models
+
     def check_connection(self) -> bool:
         """
         Check if Ollama server is accessible
@@ -48,20 +185,17 @@ class OllamaClient:
             True if connected, False otherwise
         """
         try:
-            response = requests.get(f"{self.host}/api/tags", timeout=5)
-            if response.status_code == 200:
-                self.logger.info("✓ Connected to Ollama server")
-                return True
-            else:
-                self.logger.error(f"Ollama server returned status {response.status_code}")
+            if self._get_tags() is None:
                 return False
+            self.logger.info("✓ Connected to Ollama server")
+            return True
         except requests.exceptions.ConnectionError:
             self.logger.error(
                 f"Could not connect to Ollama at {self.host}. "
                 "Make sure Ollama is running: `ollama serve`"
             )
             return False
-        except Exception as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             self.logger.error(f"Error connecting to Ollama: {e}")
             return False
 
@@ -73,16 +207,22 @@ class OllamaClient:
             List of model names
         """
         try:
-            response = requests.get(f"{self.host}/api/tags", timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                models = [model["name"] for model in data.get("models", [])]
-                return models
-            return []
-        except Exception as e:
+            return self._get_tags() or []
+        except (requests.exceptions.RequestException, ValueError) as e:
             self.logger.error(f"Error listing models: {e}")
             return []
 
+    def validate(self) -> bool:
+        """
+        Check the server is reachable and the required models are installed
+
+        Both checks share one /api/tags request.
+
+        Returns:
+            True if Ollama is ready to use
+        """
+        return self.check_connection() and self.check_models()
+
     def check_models(self) -> bool:
         """
         Check if required models are available
@@ -142,6 +282,11 @@ class OllamaClient:
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
         model: Optional[str] = None,
+        should_abort: Optional[Callable[[str], bool]] = None,
+        cache: bool = True,
+        stream: bool = False,
+        on_token: Optional[Callable[[str], None]] = None,
+        accept: Optional[Callable[[str], bool]] = None,
     ) -> Optional[str]:
         """
         Generate text using text model
@@ -152,17 +297,43 @@ class OllamaClient:
             temperature: Sampling temperature (0.0 - 1.0)
             max_tokens: Maximum tokens to generate
             model: Model to use (default: self.text_model)
+            should_abort: Optional check run on the partial output while streaming;
+                returning True stops generation early (the partial text is returned)
+            cache: Reuse the response of an identical earlier request; pass False
+                when a fresh sample is needed (e.g. retries after failed validation)
+            stream: Consume the response as NDJSON chunks instead of one body
+                (implied by should_abort and on_token)
+            on_token: Optional callback receiving each chunk of text as it arrives
+                (a cached response arrives as a single chunk)
+            accept: Optional check (e.g. the caller's validation) a response must pass
+                to be cached; a cached response that fails it is evicted and regenerated
 
         Returns:
             Generated text or None if error
         """
         model = model or self.text_model
 
+        if cache:
+            cache_key = PromptCache.make_key(
+                m=model, p=prompt, s=system_prompt, t=round(temperature, 3), n=max_tokens
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None and accept is not None and not accept(cached):
+                self.logger.debug("Evicting cached response that fails validation")
+                self.cache.delete(cache_key)
+                cached = None
+            if cached is not None:
+                self.logger.debug("Returning cached response")
+                if on_token is not None:
+                    on_token(cached)
+                return cached
+
         try:
             payload = {
                 "model": model,
                 "prompt": prompt,
                 "stream": False,
+                "keep_alive": self.keep_alive,
                 "options": {
                     "temperature": temperature,
                 },
@@ -176,16 +347,25 @@ class OllamaClient:
 
             self.logger.debug(f"Generating text with model: {model}")
 
-            response = requests.post(
+            if stream or should_abort is not None or on_token is not None:
+                generated_text, completed = self._generate_streaming(payload, should_abort, on_token)
+                # Aborted streams return partial text - only cache complete generations
+                if cache and completed and generated_text and (accept is None or accept(generated_text)):
+                    self.cache.set(cache_key, generated_text)
+                return generated_text
+
+            response = self.session.post(
                 f"{self.host}/api/generate",
                 json=payload,
                 timeout=self.timeout,
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 generated_text = data.get("response", "")
                 self.logger.debug(f"Generated {len(generated_text)} characters")
+                if cache and generated_text and (accept is None or accept(generated_text)):
+                    self.cache.set(cache_key, generated_text)
                 return generated_text
             else:
                 self.logger.error(f"Ollama API error: {response.status_code} - {response.text}")
@@ -194,53 +374,153 @@ class OllamaClient:
         except requests.exceptions.Timeout:
             self.logger.error(f"Ollama request timed out after {self.timeout}s")
             return None
-        except Exception as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             self.logger.error(f"Error generating text: {e}")
             return None
 
+    def generate_many(
+        self, prompts: List[str], max_concurrent: int = 4, **kwargs
+    ) -> List[Optional[str]]:
+        """
+        Generate text for several independent prompts concurrently
+
+        Requests share the pooled session; start Ollama with OLLAMA_NUM_PARALLEL > 1
+        so the server decodes them side by side instead of queueing them.
+
+        Args:
+            prompts: Prompts to generate for
+            max_concurrent: Maximum number of requests in flight
+            **kwargs: Additional arguments for generate_text()
+
+        Returns:
+            Generated texts in the same order as prompts (None for failures)
+        """
+        if not prompts:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrent, len(prompts)))) as executor:
+            return list(executor.map(lambda prompt: self.generate_text(prompt, **kwargs), prompts))
+
+    def _generate_streaming(
+        self,
+        payload: Dict[str, Any],
+        should_abort: Optional[Callable[[str], bool]] = None,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[Optional[str], bool]:
+        """
+        Stream a generation, stopping as soon as should_abort flags the partial text
+
+        Closing the connection makes Ollama stop decoding, so a doomed
+        generation doesn't run to max_tokens.
+
+        Args:
+            payload: Request payload for /api/generate
+            should_abort: Optional check run on the accumulated text after each chunk
+            on_token: Optional callback receiving each chunk of text
+
+        Returns:
+            Tuple of (generated, possibly partial, text or None if error,
+            True if the model finished rather than being aborted)
+        """
+        payload = {**payload, "stream": True}
+
+        with self.session.post(
+            f"{self.host}/api/generate",
+            json=payload,
+            timeout=self.timeout,
+            stream=True,
+        ) as response:
+            if response.status_code != 200:
+                self.logger.error(f"Ollama API error: {response.status_code} - {response.text}")
+                return None, False
+
+            generated_text = ""
+            completed = False
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = json_loads(line)
+                chunk = data.get("response", "")
+                generated_text += chunk
+                if chunk and on_token is not None:
+                    on_token(chunk)
+                if data.get("done"):
+                    completed = True
+                    break
+                if should_abort is not None and should_abort(generated_text):
+                    self.logger.debug(f"Generation aborted early after {len(generated_text)} characters")
+                    break
+
+        self.logger.debug(f"Generated {len(generated_text)} characters")
+        return generated_text, completed
+
     def analyze_image(
         self,
-        image_path: str,
+        image_path: Optional[str],
         prompt: str,
         model: Optional[str] = None,
+        cache: bool = True,
+        image_bytes: Optional[bytes] = None,
     ) -> Optional[str]:
         """
         Analyze an image using vision model
 
         Args:
-            image_path: Path to image file
+            image_path: Path to image file (None when image_bytes is given)
             prompt: Prompt describing what to analyze
             model: Vision model to use (default: self.vision_model)
+            cache: Reuse the analysis of an identical image and prompt
+            image_bytes: In-memory image (e.g. a Playwright screenshot), so no file is needed
+
+        Raises:
+            ValueError: If not exactly one of image_path and image_bytes is given
 
         Returns:
             Analysis result or None if error
         """
+        if (image_path is None) == (image_bytes is None):
+            raise ValueError("analyze_image needs exactly one of image_path or image_bytes")
+
         model = model or self.vision_model
 
         try:
-            # Read and encode image
-            with open(image_path, "rb") as f:
-                image_data = base64.b64encode(f.read()).decode("utf-8")
+            if cache:
+                image_hash = (
+                    hashlib.sha256(image_bytes).hexdigest()
+                    if image_bytes is not None
+                    else self._hash_file(image_path)
+                )
+                cache_key = PromptCache.make_key(m=model, p=prompt, i=image_hash)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    self.logger.debug("Returning cached image analysis")
+                    return cached
 
             payload = {
                 "model": model,
                 "prompt": prompt,
-                "images": [image_data],
                 "stream": False,
+                "keep_alive": self.keep_alive,
             }
 
             self.logger.debug(f"Analyzing image with model: {model}")
 
-            response = requests.post(
-                f"{self.host}/api/generate",
-                json=payload,
-                timeout=self.timeout,
-            )
+            # Image is encoded while the body is sent (chunked transfer)
+            image_source = io.BytesIO(image_bytes) if image_bytes is not None else open(image_path, "rb")
+            with image_source as image_file:
+                response = self.session.post(
+                    f"{self.host}/api/generate",
+                    data=self._image_request_body(payload, image_file),
+                    headers={"Content-Type": "application/json"},
+                    timeout=self.timeout,
+                )
 
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 analysis = data.get("response", "")
                 self.logger.debug(f"Image analysis complete ({len(analysis)} chars)")
+                if cache and analysis:
+                    self.cache.set(cache_key, analysis)
                 return analysis
             else:
                 self.logger.error(f"Ollama API error: {response.status_code} - {response.text}")
@@ -252,10 +532,44 @@ class OllamaClient:
         except requests.exceptions.Timeout:
             self.logger.error(f"Ollama request timed out after {self.timeout}s")
             return None
-        except Exception as e:
+        except (OSError, requests.exceptions.RequestException, ValueError) as e:
             self.logger.error(f"Error analyzing image: {e}")
             return None
 
+    @staticmethod
+    def _hash_file(path: str, chunk_size: int = 57 * 1024) -> str:
+        """SHA-256 hex digest of a file, read in chunks"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _image_request_body(
+        payload: Dict[str, Any], image_file: BinaryIO, chunk_size: int = 57 * 1024
+    ) -> Iterator[bytes]:
+        """
+        Stream a /api/generate JSON body with the image base64-encoded on the fly
+
+        Yields the JSON for payload with an "images" array appended, encoding
+        the file chunk by chunk. chunk_size is a multiple of 3, so each chunk
+        encodes without padding and the concatenation equals encoding the whole
+        file; neither the raw image nor its base64 form is held in one piece.
+
+        Args:
+            payload: Request fields other than images
+            image_file: Open binary image file
+            chunk_size: Bytes read per chunk
+
+        Yields:
+            Body fragments (sent with chunked transfer encoding)
+        """
+        yield json.dumps(payload)[:-1].encode("utf-8") + b', "images": ["'
+        for chunk in iter(lambda: image_file.read(chunk_size), b""):
+            yield b64encode(chunk)
+        yield b'"]}'
+
     def generate_with_prompt_file(
         self,
         prompt_file: str,
@@ -280,19 +594,19 @@ class OllamaClient:
                 self.logger.error(f"Prompt file not found: {prompt_file}")
                 return None
 
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                prompt_template = f.read()
+            prompt_template = _read_prompt_template(str(prompt_path), prompt_path.stat().st_mtime)
 
-            # Substitute variables
+            # Substitute variables in a single pass (unknown placeholders are left as-is)
             if variables:
-                for key, value in variables.items():
-                    placeholder = f"{{{{{key}}}}}"
-                    prompt_template = prompt_template.replace(placeholder, str(value))
+                prompt_template = _PLACEHOLDER_RE.sub(
+                    lambda m: str(variables[m.group(1)]) if m.group(1) in variables else m.group(0),
+                    prompt_template,
+                )
 
             # Generate text
             return self.generate_text(prompt_template, **kwargs)
 
-        except Exception as e:
+        except (OSError, UnicodeDecodeError) as e:
             self.logger.error(f"Error processing prompt file: {e}")
             return None
 
@@ -311,27 +625,39 @@ class OllamaClient:
         """
         try:
             # Try direct parsing first
-            return json.loads(text)
+            return json_loads(text)
         except json.JSONDecodeError:
             pass
 
-        # Try to find JSON in markdown code blocks
-        import re
+        if "{" not in text:
+            self.logger.warning("Could not extract JSON from LLM response")
+            return None
 
-        patterns = [
-            r"```json\s*(\{.*?\})\s*```",  # JSON in code block
-            r"```\s*(\{.*?\})\s*```",  # Code block without language
-            r"(\{.*\})",  # Raw JSON
-        ]
+        # Fast path: outermost braces usually delimit the whole object
+        start, end = text.find("{"), text.rfind("}")
+        if start >= 0 and end > start:
+            try:
+                return json_loads(text[start:end + 1])
+            except json.JSONDecodeError:
+                pass
 
-        for pattern in patterns:
-            match = re.search(pattern, text, re.DOTALL)
+        # Try to find JSON in markdown code blocks
+        for pattern in _JSON_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
-                    return json.loads(match.group(1))
+                    return json_loads(match.group(1))
                 except json.JSONDecodeError:
                     continue
 
+        # Raw JSON surrounded by text: try each balanced span in turn
+        span = _find_json_span(text)
+        while span:
+            try:
+                return json_loads(text[span[0]:span[1]])
+            except json.JSONDecodeError:
+                span = _find_json_span(text, span[0] + 1)
+
         self.logger.warning("Could not extract JSON from LLM response")
         return None
 
@@ -341,19 +667,32 @@ _ollama_client = None
 
 
 def get_ollama_client() -> OllamaClient:
-    """Get or create Ollama client singleton"""
+    """
+    Get or create Ollama client singleton
+
+    OLLAMA_NUM_PARALLEL is read by the Ollama server, not this client: set it
+    above 1 where `ollama serve` runs so concurrent requests (generate_many,
+    batched material generation) are decoded in parallel.
+    """
     global _ollama_client
     if _ollama_client is None:
         host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
         text_model = os.getenv("OLLAMA_TEXT_MODEL", "llama3.1:8b")
         vision_model = os.getenv("OLLAMA_VISION_MODEL", "llava:13b")
         timeout = int(os.getenv("OLLAMA_TIMEOUT", "300"))
+        keep_alive = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+        cache_max_entries = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000"))
+        cache_ttl = os.getenv("LLM_CACHE_TTL")  # seconds, unset = never expire
 
         _ollama_client = OllamaClient(
             host=host,
             text_model=text_model,
             vision_model=vision_model,
             timeout=timeout,
+            keep_alive=keep_alive,
+            cache_max_entries=cache_max_entries,
+            cache_ttl=int(cache_ttl) if cache_ttl else None,
         )
+        atexit.register(_ollama_client.close)
 
     return _ollama_client
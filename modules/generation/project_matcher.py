@@ -4,13 +4,49 @@ Project Matcher
 Intelligently matches candidate's projects to job descriptions using LLM.
 """
 
-import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 from modules.generation.ollama_client import get_ollama_client
 from modules.scraping.job_models import JobPosting
 from modules.core.logger import get_logger
+from modules.utils.helpers import json_loads
+
+# {{variable}} placeholders in prompt templates
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+def _read_if_exists(path: Path) -> Optional[str]:
+    """Read a text file, or return None if it doesn't exist or can't be read"""
+    if not path.exists():
+        return None
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        get_logger().warning(f"Skipping unreadable project details {path}: {e}")
+        return None
+
+
+def _score_of(score_data: Dict[str, Any]) -> float:
+    """Numeric score of a project_scores entry (0 when the model gave none or a non-number)"""
+    score = score_data.get("score", 0)
+    return score if isinstance(score, (int, float)) else 0
+
+
+def _project_problem(project: Any) -> Optional[str]:
+    """Describe what is wrong with a projects_index.json entry, or None if it is usable"""
+    if not isinstance(project, dict):
+        return "entry is not an object"
+    for field in ("id", "name"):
+        if not isinstance(project.get(field), str) or not project[field]:
+            return f"missing or non-string '{field}'"
+    for field in ("keywords", "tech_stack"):
+        value = project.get(field, [])
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            return f"'{field}' must be a list of strings"
+    return None
 
 
 class ProjectMatcher:
@@ -25,12 +61,37 @@ class ProjectMatcher:
         """
         self.portfolio_dir = Path(portfolio_dir)
         self.projects = []
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._details_formatted: Dict[str, str] = {}
         self.logger = get_logger()
         self.ollama = get_ollama_client()
 
+        # Formatted project list, built on first use after each load
+        self._formatted_cache: Optional[str] = None
+
         # Load projects
         self.load_projects()
 
+        # Pre-split the matching prompt: even indices are literal text,
+        # odd indices are placeholder names spliced per job
+        self._prompt_parts = self._load_prompt_parts(Path("prompts/project_matching.txt"))
+        self._batch_prompt_parts = self._load_prompt_parts(Path("prompts/project_matching_batch.txt"))
+
+    def _load_prompt_parts(self, prompt_path: Path) -> List[str]:
+        """Read a {{variable}} prompt template and split it around its placeholders"""
+        if not prompt_path.exists():
+            raise FileNotFoundError(f"Project matching prompt template not found: {prompt_path}")
+        with open(prompt_path, "r", encoding="utf-8") as f:
+            return _PLACEHOLDER_RE.split(f.read())
+
+    def _build_prompt(self, variables: Dict[str, Any], prompt_parts: Optional[List[str]] = None) -> str:
+        """Splice variables into a pre-split matching prompt in a single pass"""
+        parts = list(prompt_parts if prompt_parts is not None else self._prompt_parts)
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            parts[i] = str(variables[name]) if name in variables else f"{{{{{name}}}}}"
+        return "".join(parts)
+
     def load_projects(self):
         """Load projects from portfolio directory"""
         projects_index_path = self.portfolio_dir / "projects_index.json"
@@ -43,22 +104,40 @@ class ProjectMatcher:
             return
 
         try:
-            with open(projects_index_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.projects = data.get("projects", [])
+            data = json_loads(projects_index_path.read_bytes())
+            entries = data.get("projects", []) if isinstance(data, dict) else None
+            if not isinstance(entries, list):
+                self.logger.error(f"Error loading projects: no \"projects\" list in {projects_index_path}")
+                return
+
+            # Skip malformed entries so one bad project doesn't drop the whole portfolio
+            self.projects = []
+            for i, project in enumerate(entries, 1):
+                problem = _project_problem(project)
+                if problem:
+                    self.logger.warning(f"Skipping project {i} in {projects_index_path.name}: {problem}")
+                else:
+                    self.projects.append(project)
 
             self.logger.info(f"✓ Loaded {len(self.projects)} projects from portfolio")
 
-            # Load detailed descriptions if available
-            for project in self.projects:
-                project_id = project.get("id")
-                md_path = self.portfolio_dir / "projects" / f"{project_id}.md"
-
-                if md_path.exists():
-                    with open(md_path, "r", encoding="utf-8") as f:
-                        project["detailed_description"] = f.read()
-
-        except Exception as e:
+            # Load detailed descriptions if available (reads overlap on a thread pool)
+            projects_dir = self.portfolio_dir / "projects"
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                contents = executor.map(
+                    lambda project: _read_if_exists(projects_dir / f"{project['id']}.md"),
+                    self.projects,
+                )
+                for project, content in zip(self.projects, contents):
+                    if content is not None:
+                        project["detailed_description"] = content
+
+            # Project data is fixed after load - index it for O(1) lookups
+            self._by_id = {p["id"]: p for p in self.projects}
+            self._details_formatted = {}
+            self._formatted_cache = None
+
+        except (OSError, ValueError) as e:
             self.logger.error(f"Error loading projects: {e}")
 
     def format_projects_for_prompt(self) -> str:
@@ -68,6 +147,9 @@ class ProjectMatcher:
         Returns:
             Formatted project list
         """
+        if self._formatted_cache is not None:
+            return self._formatted_cache
+
         formatted = []
 
         for i, project in enumerate(self.projects, 1):
@@ -85,7 +167,8 @@ Key Metrics: {project.get('key_metrics', 'N/A')}
 
             formatted.append(proj_text)
 
-        return "\n---\n".join(formatted)
+        self._formatted_cache = "\n---\n".join(formatted)
+        return self._formatted_cache
 
     def match_projects(
         self, job: JobPosting, top_n: int = 3
@@ -110,36 +193,140 @@ Key Metrics: {project.get('key_metrics', 'N/A')}
                 "error": "No projects loaded"
             }
 
-        # Read prompt template
-        prompt_path = Path("prompts/project_matching.txt")
-        if not prompt_path.exists():
-            self.logger.error("Project matching prompt template not found")
-            return {"error": "Prompt template not found"}
+        prompt = self._build_match_prompt(job)
 
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            prompt_template = f.read()
+        # Generate matching analysis
+        self.logger.info("Analyzing project matches with Llama...")
+
+        response = self.ollama.generate_text(
+            prompt,
+            temperature=0.3,  # Lower temperature for more consistent scoring
+        )
+
+        return self._parse_match_response(response, top_n)
+
+    def match_projects_batch(
+        self,
+        jobs: List[JobPosting],
+        top_n: int = 3,
+        max_concurrent: int = 4,
+        jobs_per_prompt: int = 1,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Match projects to several job postings with concurrent LLM requests
+
+        With jobs_per_prompt > 1, groups of jobs share one prompt so the
+        portfolio block (placed first, byte-identical every time) is prefilled
+        once per group instead of once per job.
+
+        Args:
+            jobs: Job postings to match against
+            top_n: Number of top projects to return per job
+            max_concurrent: Maximum number of matching requests in flight
+            jobs_per_prompt: Number of jobs scored by a single LLM call
+
+        Returns:
+            List of match results in the same order as jobs (None for jobs a
+            multi-job response left unmatched; match those with match_projects)
+        """
+        if not self.projects:
+            return [self.match_projects(job, top_n) for job in jobs]
+
+        self.logger.info(f"Matching projects for {len(jobs)} jobs (up to {max_concurrent} at once)...")
+
+        if jobs_per_prompt <= 1:
+            responses = self.ollama.generate_many(
+                [self._build_match_prompt(job) for job in jobs],
+                max_concurrent=max_concurrent,
+                temperature=0.3,  # Lower temperature for more consistent scoring
+            )
+            return [self._parse_match_response(response, top_n) for response in responses]
+
+        groups = [jobs[i:i + jobs_per_prompt] for i in range(0, len(jobs), jobs_per_prompt)]
+        responses = self.ollama.generate_many(
+            [self._build_batch_prompt(group) for group in groups],
+            max_concurrent=max_concurrent,
+            temperature=0.3,
+        )
+
+        results = []
+        for group, response in zip(groups, responses):
+            results.extend(self._parse_batch_response(group, response, top_n))
+        return results
+
+    def _build_batch_prompt(self, jobs: List[JobPosting]) -> str:
+        """Build one matching prompt covering several numbered jobs"""
+        jobs_text = "\n---\n".join(
+            f"JOB {i}:\nCOMPANY: {job.company}\nTITLE: {job.title}\n"
+            f"JOB DESCRIPTION:\n{job.description[:2000]}"
+            for i, job in enumerate(jobs, 1)
+        )
+        variables = {
+            "projects": self.format_projects_for_prompt(),
+            "jobs": jobs_text,
+        }
+        return self._build_prompt(variables, self._batch_prompt_parts)
+
+    def _parse_batch_response(
+        self, jobs: List[JobPosting], response: Optional[str], top_n: int
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Split a multi-job matching response into per-job match results
 
-        # Prepare prompt variables
+        Accepts {"jobs": [...]} or a bare list of job entries. Entries are
+        matched to jobs by job_number, or by position when it is missing.
+
+        Args:
+            jobs: Jobs included in the prompt, in prompt order
+            response: Raw LLM response (None if generation failed)
+            top_n: Number of top projects to return per job
+
+        Returns:
+            List of match results in the same order as jobs (None for jobs
+            missing from the response, to be matched individually)
+        """
+        result = self.ollama.extract_json(response) if response else None
+        if isinstance(result, dict):
+            result = result.get("jobs")
+
+        entries = {}
+        if isinstance(result, list):
+            for position, entry in enumerate(result, 1):
+                if isinstance(entry, dict):
+                    entries.setdefault(entry.get("job_number", position), entry)
+
+        results = []
+        for i, job in enumerate(jobs, 1):
+            entry = entries.get(i)
+            if entry and isinstance(entry.get("project_scores"), list):
+                self.logger.info(f"Matched projects for: {job.company} - {job.title}")
+                results.append(self._format_match_result(entry, top_n))
+            else:
+                self.logger.warning(f"Batch match missing job {i}, it will be matched individually")
+                results.append(None)
+        return results
+
+    def _build_match_prompt(self, job: JobPosting) -> str:
+        """Build the project matching prompt for a job"""
         variables = {
             "job_description": job.description[:2000],  # Limit length
             "company": job.company,
             "title": job.title,
             "projects": self.format_projects_for_prompt(),
         }
+        return self._build_prompt(variables)
 
-        # Substitute variables
-        prompt = prompt_template
-        for key, value in variables.items():
-            prompt = prompt.replace(f"{{{{{key}}}}}", str(value))
-
-        # Generate matching analysis
-        self.logger.info("Analyzing project matches with Llama...")
+    def _parse_match_response(self, response: Optional[str], top_n: int) -> Dict[str, Any]:
+        """
+        Turn a project matching LLM response into a match result
 
-        response = self.ollama.generate_text(
-            prompt,
-            temperature=0.3,  # Lower temperature for more consistent scoring
-        )
+        Args:
+            response: Raw LLM response (None if generation failed)
+            top_n: Number of top projects to return
 
+        Returns:
+            Dictionary containing matched projects and scores
+        """
         if not response:
             self.logger.error("Failed to get LLM response for project matching")
             return {"error": "LLM generation failed"}
@@ -147,7 +334,7 @@ Key Metrics: {project.get('key_metrics', 'N/A')}
         # Parse JSON response
         result = self.ollama.extract_json(response)
 
-        if not result:
+        if not isinstance(result, dict) or not result:
             self.logger.error("Failed to parse JSON from LLM response")
             self.logger.debug(f"Raw response: {response[:500]}")
             # Fallback: return all projects with default scores
@@ -165,12 +352,29 @@ Key Metrics: {project.get('key_metrics', 'N/A')}
                 "fallback": True,
             }
 
+        return self._format_match_result(result, top_n)
+
+    def _format_match_result(self, result: Dict[str, Any], top_n: int) -> Dict[str, Any]:
+        """
+        Keep the top N scored projects from a parsed matching response
+
+        Args:
+            result: Parsed JSON for one job
+            top_n: Number of top projects to return
+
+        Returns:
+            Dictionary containing matched projects and scores
+        """
         # Extract top projects
-        top_project_ids = result.get("top_projects", [])[:top_n]
-        project_scores = result.get("project_scores", [])
+        top_projects = result.get("top_projects")
+        top_project_ids = top_projects[:top_n] if isinstance(top_projects, list) else []
+        project_scores = result.get("project_scores")
+        if not isinstance(project_scores, list):
+            project_scores = []
+        project_scores = [score for score in project_scores if isinstance(score, dict)]
 
         # Sort by score and get top N
-        project_scores.sort(key=lambda x: x.get("score", 0), reverse=True)
+        project_scores.sort(key=_score_of, reverse=True)
         top_scores = project_scores[:top_n]
 
         self.logger.info(f"✓ Matched top {len(top_project_ids)} projects:")
@@ -197,10 +401,7 @@ Key Metrics: {project.get('key_metrics', 'N/A')}
         Returns:
             Project dictionary or None
         """
-        for project in self.projects:
-            if project.get("id") == project_id:
-                return project
-        return None
+        return self._by_id.get(project_id)
 
     def get_project_details(self, project_id: str) -> str:
         """
@@ -212,6 +413,9 @@ Key Metrics: {project.get('key_metrics', 'N/A')}
         Returns:
             Formatted project details
         """
+        if project_id in self._details_formatted:
+            return self._details_formatted[project_id]
+
         project = self.get_project_by_id(project_id)
         if not project:
             return ""
@@ -224,6 +428,7 @@ Key Metrics: {project.get('key_metrics', 'N/A')}
         if 'detailed_description' in project:
             details += f"\nDetails:\n{project['detailed_description']}\n"
 
+        self._details_formatted[project_id] = details
         return details
 
 
@@ -0,0 +1,228 @@
+"""
+Prompt Cache
+
+Persistent exact-match cache for LLM responses.
+Identical requests are answered from memory or SQLite instead of the model.
+"""
+
+import json
+import time
+import hashlib
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# Memory hits buffered before their last_used times are written to SQLite
+_TOUCH_BATCH_SIZE = 64
+
+
+class PromptCache:
+    """
+    Two-level response cache: in-memory LRU in front of a SQLite table
+
+    Table structure:
+        key        SHA-256 of the request (see make_key)
+        response   Cached model output
+        created_at Unix time the entry was stored (drives the TTL)
+        last_used  Unix time of the last hit (drives LRU eviction)
+    """
+
+    def __init__(
+        self,
+        path: str = "workspace/.llm_cache.db",
+        max_entries: int = 10000,
+        ttl_seconds: Optional[int] = None,
+        memory_entries: int = 2048,
+    ):
+        """
+        Initialize prompt cache
+
+        Args:
+            path: SQLite database file
+            max_entries: Maximum rows kept on disk (least recently used are evicted)
+            ttl_seconds: Age after which entries are ignored (None = never expire)
+            memory_entries: Size of the in-memory LRU front
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.memory_entries = memory_entries
+        self.logger = logging.getLogger(__name__)
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # last_used of memory hits, written back in batches (key -> hit time)
+        self._pending_touches: Dict[str, float] = {}
+
+        # Let the table overshoot max_entries a little so eviction runs once per
+        # batch of inserts instead of on every insert at capacity
+        self._evict_slack = max(1, max_entries // 100)
+
+        # One connection shared across threads, serialized by the lock
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON responses(last_used)")
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(**request: Any) -> str:
+        """
+        Build a deterministic key from request fields
+
+        Args:
+            **request: JSON-serializable request fields (model, prompt, ...)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get cached response
+
+        Args:
+            key: Request key from make_key
+
+        Returns:
+            Cached response or None if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._expired(entry[1], now):
+                self._memory.move_to_end(key)
+                self._pending_touches[key] = now
+                if len(self._pending_touches) >= _TOUCH_BATCH_SIZE:
+                    try:
+                        self._flush_touches()
+                        self._conn.commit()
+                    except sqlite3.Error as e:
+                        self.logger.error(f"Error updating prompt cache: {e}")
+                return entry[0]
+
+            try:
+                row = self._conn.execute(
+                    "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or self._expired(row[1], now):
+                    return None
+                self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error reading prompt cache: {e}")
+                return None
+
+            self._remember(key, row[0], row[1])
+            return row[0]
+
+    def set(self, key: str, response: str):
+        """
+        Store a response
+
+        Args:
+            key: Request key from make_key
+            response: Model output to cache
+        """
+        now = time.time()
+        with self._lock:
+            self._remember(key, response, now)
+            try:
+                # Only a new row counts towards max_entries; an existing key is overwritten
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO responses (key, response, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, response, now, now),
+                )
+                if cursor.rowcount:
+                    self._count += 1
+                else:
+                    self._conn.execute(
+                        "UPDATE responses SET response = ?, created_at = ?, last_used = ? WHERE key = ?",
+                        (response, now, now, key),
+                    )
+                if self._count > self.max_entries + self._evict_slack:
+                    self._evict()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error writing prompt cache: {e}")
+
+    def delete(self, key: str):
+        """
+        Drop a cached response
+
+        Args:
+            key: Request key from make_key
+        """
+        with self._lock:
+            self._memory.pop(key, None)
+            self._pending_touches.pop(key, None)
+            try:
+                cursor = self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._count -= max(cursor.rowcount, 0)
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error deleting from prompt cache: {e}")
+
+    def _remember(self, key: str, response: str, created_at: float):
+        """Put an entry in the in-memory LRU front"""
+        self._memory[key] = (response, created_at)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _flush_touches(self):
+        """Write the last_used times of pending memory hits to SQLite (caller commits)"""
+        if not self._pending_touches:
+            return
+        self._conn.executemany(
+            "UPDATE responses SET last_used = ? WHERE key = ?",
+            [(used, key) for key, used in self._pending_touches.items()],
+        )
+        self._pending_touches.clear()
+
+    def _evict(self):
+        """Drop expired rows and the least recently used rows beyond max_entries"""
+        # Memory hits must be on disk first, or hot entries look least recently used
+        self._flush_touches()
+        if self.ttl_seconds is not None:
+            self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN "
+            "(SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        self._count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            try:
+                self._flush_touches()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self.logger.error(f"Error updating prompt cache: {e}")
+            self._conn.close()
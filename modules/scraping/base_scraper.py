@@ -9,12 +9,64 @@ from typing import List, Optional
 from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Playwright
 import time
 import random
+import atexit
+from collections import deque
+import threading
 from pathlib import Path
-import json
 
 from modules.scraping.job_models import JobPosting, ScraperConfig
+from modules.scraping.cache import get_scrape_cache
 from modules.core.logger import get_logger
-from modules.utils.helpers import rate_limit_delay
+from modules.utils.helpers import json_dumps_bytes
+from modules.utils.rate_limiter import get_bucket
+
+# Process-wide Playwright driver and browser, shared by every scraper instance
+# so only the first platform pays the Chromium cold start
+_playwright_singleton: Optional[Playwright] = None
+_browser_singleton: Optional[Browser] = None
+_playwright_lock = threading.Lock()
+
+# Keeps navigator.webdriver unset so LinkedIn serves the normal (cached) page
+_PERSISTENT_ARGS = ["--disable-blink-features=AutomationControlled"]
+
+# Resource types the scrapers never read; images are only needed for vision screenshots
+_BLOCKED_RESOURCE_TYPES = frozenset({"font", "media"})
+_BLOCKED_RESOURCE_TYPES_NO_VISION = _BLOCKED_RESOURCE_TYPES | {"image"}
+
+
+def get_playwright() -> Playwright:
+    """Get or start the shared Playwright driver"""
+    global _playwright_singleton
+    with _playwright_lock:
+        if _playwright_singleton is None:
+            _playwright_singleton = sync_playwright().start()
+            atexit.register(_shutdown_playwright)
+        return _playwright_singleton
+
+
+def get_browser(headless: bool) -> Browser:
+    """Get or launch the shared (non-persistent) Chromium browser"""
+    global _browser_singleton
+    playwright = get_playwright()
+    with _playwright_lock:
+        if _browser_singleton is None or not _browser_singleton.is_connected():
+            _browser_singleton = playwright.chromium.launch(headless=headless)
+        return _browser_singleton
+
+
+def _shutdown_playwright():
+    """Close the shared browser and stop the driver at interpreter exit"""
+    global _playwright_singleton, _browser_singleton
+    with _playwright_lock:
+        try:
+            if _browser_singleton is not None:
+                _browser_singleton.close()
+            if _playwright_singleton is not None:
+                _playwright_singleton.stop()
+        except Exception:
+            pass
+        _browser_singleton = None
+        _playwright_singleton = None
 
 
 class BaseScraper(ABC):
@@ -34,7 +86,10 @@ class BaseScraper(ABC):
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.jobs: List[JobPosting] = []
-        
+        # Detail extractions rendered in the current context (see _note_page_use)
+        self._pages_since_recycle = 0
+        self.scrape_cache = get_scrape_cache() if config.use_scrape_cache else None
+
         # Persistent session storage
         self.session_dir = Path("workspace/.browser_sessions")
         self.session_dir.mkdir(parents=True, exist_ok=True)
@@ -59,44 +114,28 @@ class BaseScraper(ABC):
             persistent: If True, uses persistent browser context (saves cookies/session)
         """
         try:
-            self.playwright = sync_playwright().start()
+            self.playwright = get_playwright()
             
             # Create persistent context path for this platform
-            context_path = self.session_dir / f"{self.platform_name}_context"
-            
-            if persistent and context_path.exists():
-                # Use existing persistent context
-                self.logger.info(f"Loading existing browser session for {self.platform_name}...")
-                self.context = self.playwright.chromium.launch_persistent_context(
-                    user_data_dir=str(context_path),
-                    headless=self.config.headless,
-                    channel=None,  # Use default Chromium
-                )
-                # Get the first page from persistent context
-                if len(self.context.pages) > 0:
-                    self.page = self.context.pages[0]
+            context_path = self._context_path()
+
+            if persistent:
+                if context_path.exists():
+                    self.logger.info(f"Loading existing browser session for {self.platform_name}...")
                 else:
-                    self.page = self.context.new_page()
-            else:
-                # Create new browser with persistent context
-                if persistent:
                     self.logger.info(f"Creating new persistent browser session for {self.platform_name}...")
-                    self.context = self.playwright.chromium.launch_persistent_context(
-                        user_data_dir=str(context_path),
-                        headless=self.config.headless,
-                        channel=None,
-                    )
-                    if len(self.context.pages) > 0:
-                        self.page = self.context.pages[0]
-                    else:
-                        self.page = self.context.new_page()
-                else:
-                    # Non-persistent (old behavior)
-                    self.browser = self.playwright.chromium.launch(
-                        headless=self.config.headless
-                    )
-                    self.context = self.browser.new_context()
-                    self.page = self.context.new_page()
+                self._launch_persistent_context(context_path)
+            else:
+                # Non-persistent: fresh context on the shared browser, reusing
+                # saved cookies/consent from the last run when available
+                self.browser = get_browser(self.config.headless)
+                state_path = self.config.storage_state_path
+                self.context = self.browser.new_context(
+                    storage_state=state_path if state_path and Path(state_path).exists() else None
+                )
+                self.page = self.context.new_page()
+
+            self._block_resources(self.context)
 
             # Set timeout
             self.page.set_default_timeout(self.config.timeout)
@@ -107,6 +146,57 @@ class BaseScraper(ABC):
             self.logger.error(f"Error starting browser: {e}")
             raise
 
+    def _context_path(self) -> Path:
+        """Chromium profile directory for the persistent context"""
+        if self.config.user_data_dir:
+            return Path(self.config.user_data_dir)
+        return self.session_dir / f"{self.platform_name}_context"
+
+    def _launch_persistent_context(self, context_path: Path):
+        """
+        Launch the persistent context and take its first page
+
+        Args:
+            context_path: Chromium profile directory (holds the saved login)
+        """
+        self.context = self.playwright.chromium.launch_persistent_context(
+            user_data_dir=str(context_path),
+            headless=self.config.headless,
+            channel=None,  # Use default Chromium
+            args=_PERSISTENT_ARGS,
+        )
+        if len(self.context.pages) > 0:
+            self.page = self.context.pages[0]
+        else:
+            self.page = self.context.new_page()
+
+    def _block_resources(self, context: BrowserContext):
+        """
+        Abort requests for resources the scraper doesn't read
+
+        Only HTML and XHR are parsed, so fonts and media are dropped; images are
+        kept while vision fallback may screenshot job cards. Stylesheets stay so
+        panel layout (and screenshots) still render.
+
+        Args:
+            context: Browser context to install the route on
+        """
+        if not self.config.block_resources:
+            return
+
+        blocked = (
+            _BLOCKED_RESOURCE_TYPES if self.config.vision_fallback
+            else _BLOCKED_RESOURCE_TYPES_NO_VISION
+        )
+
+        def handle(route):
+            if route.request.resource_type in blocked:
+                route.abort()
+            else:
+                route.continue_()
+
+        context.route("**/*", handle)
+
     def close_browser(self, save_session: bool = True):
         """
         Close browser and cleanup
@@ -120,35 +210,124 @@ class BaseScraper(ABC):
                 try:
                     cookies_path = self.session_dir / f"{self.platform_name}_cookies.json"
                     cookies = self.context.cookies()
-                    with open(cookies_path, 'w') as f:
-                        json.dump(cookies, f, indent=2)
+                    with open(cookies_path, 'wb') as f:
+                        f.write(json_dumps_bytes(cookies, indent=True))
                     self.logger.debug(f"Saved cookies to {cookies_path}")
                 except Exception as e:
                     self.logger.debug(f"Could not save cookies: {e}")
+
+            # Save storage state so the next run starts past consent/auth pages
+            if save_session and self.context and self.config.storage_state_path:
+                try:
+                    self.context.storage_state(path=self.config.storage_state_path)
+                    self.logger.debug(f"Saved storage state to {self.config.storage_state_path}")
+                except Exception as e:
+                    self.logger.debug(f"Could not save storage state: {e}")
             
             # Close page and context/browser
             if self.page and not self.context:
                 # Only close page if not using persistent context
                 self.page.close()
             
+            # Shared browser and driver stay up for other scrapers (stopped at exit)
             if self.context:
                 self.context.close()
-            elif self.browser:
-                self.browser.close()
-                
-            if self.playwright:
-                self.playwright.stop()
 
             self.logger.info(f"✓ Browser closed")
 
         except Exception as e:
             self.logger.error(f"Error closing browser: {e}")
 
+    def _open_search_page(self):
+        """
+        Swap in a clean page for the next search term, closing the previous one
+
+        Non-persistent scrapers get a fresh context on the shared browser (see
+        _recycle_context). Persistent sessions have a single context (it holds the
+        saved login), so they are isolated per term with a new tab instead, unless
+        the context is due for recycling anyway.
+        """
+        if self.browser is not None or self._pages_since_recycle >= self.config.pages_per_context:
+            self._recycle_context()
+            return
+
+        previous_page = self.page
+        self.page = self.context.new_page()
+        previous_page.close()
+
+        self.page.set_default_timeout(self.config.timeout)
+        self.on_page_changed()
+
+    def _recycle_context(self):
+        """
+        Replace the browser context (and page), closing the old one
+
+        Playwright only frees a context's request/response objects when it
+        closes, so this bounds memory on long scrapes. Non-persistent contexts are
+        seeded with the previous context's cookies so a login survives; the
+        persistent context is relaunched from its profile, which holds the login.
+        """
+        previous_context = self.context
+        self.logger.debug(f"Recycling browser context after {self._pages_since_recycle} pages")
+
+        if self.browser is not None:
+            self.context = self.browser.new_context(storage_state=previous_context.storage_state())
+            self.page = self.context.new_page()
+            previous_context.close()
+        else:
+            # The profile directory is locked until the old context closes
+            previous_context.close()
+            self._launch_persistent_context(self._context_path())
+
+        self._block_resources(self.context)
+        self._pages_since_recycle = 0
+        self.page.set_default_timeout(self.config.timeout)
+        self.on_page_changed()
+
+    def _load_search_results(self, search_url: str) -> list:
+        """
+        Open a search results page and extract its job cards
+
+        Args:
+            search_url: Search URL from build_search_url
+
+        Returns:
+            Job cards from extract_job_cards
+        """
+        self.page.goto(search_url, wait_until="domcontentloaded")
+
+        # Human-like behavior: wait after page load
+        time.sleep(random.uniform(2.0, 4.0))
+
+        # Scroll to trigger lazy loading
+        self.page.evaluate("window.scrollTo(0, document.body.scrollHeight / 3)")
+        time.sleep(random.uniform(1.0, 2.5))
+
+        self.wait_for_rate_limit()
+
+        return self.extract_job_cards()
+
+    @staticmethod
+    def _card_id(job_card) -> Optional[str]:
+        """Job ID of a card from extract_job_cards, if the platform provides one"""
+        return job_card.get("job_id") if isinstance(job_card, dict) else None
+
+    @staticmethod
+    def shutdown():
+        """Close the shared browser and stop Playwright (otherwise done at exit)"""
+        _shutdown_playwright()
+
     def wait_for_rate_limit(self):
-        """Wait according to platform rate limits"""
-        delay = rate_limit_delay(self.platform_name)
-        self.logger.debug(f"Rate limit delay: {delay}s")
-        time.sleep(delay)
+        """
+        Wait according to platform rate limits
+
+        Takes a token from the platform's shared bucket: time already spent
+        extracting a job refills it, so this only sleeps when requests have
+        outpaced the platform rate (short bursts are allowed).
+        """
+        waited = get_bucket(self.platform_name).acquire()
+        if waited:
+            self.logger.debug(f"Rate limit delay: {waited:.1f}s")
 
     @abstractmethod
     def build_search_url(self, search_term: str) -> str:
@@ -178,6 +357,9 @@ class BaseScraper(ABC):
         """
         Extract detailed job information from a job card
 
+        Implementations call _note_page_use() when the details are rendered in
+        self.page (fetches that bypass the browser don't count towards recycling).
+
         Args:
             job_card_data: Job card element/data
 
@@ -186,6 +368,10 @@ class BaseScraper(ABC):
         """
         pass
 
+    def _note_page_use(self):
+        """Count a detail extraction that rendered in the page (drives context recycling)"""
+        self._pages_since_recycle += 1
+
     def scrape_jobs(self) -> List[JobPosting]:
         """
         Main scraping method
@@ -203,43 +389,56 @@ class BaseScraper(ABC):
             # Login if required (platform-specific)
             self.login_if_required()
 
-            for search_term in self.config.search_terms:
-                if len(self.jobs) >= self.config.max_results:
-                    self.logger.info(f"Reached max results limit: {self.config.max_results}")
+            max_results = self.config.max_results
+            remaining = max_results - len(self.jobs)
+
+            for term_index, search_term in enumerate(self.config.search_terms):
+                if remaining <= 0:
+                    self.logger.info(f"Reached max results limit: {max_results}")
                     break
 
                 self.logger.info(f"Searching for: {search_term}")
 
+                # Each term after the first starts from a clean page
+                if term_index > 0:
+                    self._open_search_page()
+
                 # Navigate to search page
                 search_url = self.build_search_url(search_term)
                 self.logger.debug(f"URL: {search_url}")
 
-                self.page.goto(search_url, wait_until="domcontentloaded")
-                
-                # Human-like behavior: wait after page load
-                time.sleep(random.uniform(2.0, 4.0))
-                
-                # Scroll to trigger lazy loading
-                self.page.evaluate("window.scrollTo(0, document.body.scrollHeight / 3)")
-                time.sleep(random.uniform(1.0, 2.5))
-                
-                self.wait_for_rate_limit()
-
-                # Extract job cards
-                job_cards = self.extract_job_cards()
+                job_cards = self._load_search_results(search_url)
                 self.logger.info(f"Found {len(job_cards)} job cards")
 
                 # Extract details from each card
-                for i, job_card in enumerate(job_cards):
-                    if len(self.jobs) >= self.config.max_results:
-                        break
-
-                    self.logger.info(f"Extracting job {i + 1}/{len(job_cards)}")
+                pending = deque(job_cards)
+                done_ids = set()
+                extracted = 0
+                while pending and remaining > 0:
+                    job_card = pending.popleft()
+                    extracted += 1
+                    self.logger.info(f"Extracting job {extracted}/{extracted + len(pending)}")
+
+                    card_id = self._card_id(job_card)
+                    if card_id:
+                        done_ids.add(card_id)
+
+                    # Jobs scraped on an earlier run skip extraction (and its rate limit wait)
+                    cached_job = self._cached_job(job_card)
+                    if cached_job:
+                        self.jobs.append(cached_job)
+                        remaining -= 1
+                        self.logger.info(f"✓ Cached: {cached_job.company} - {cached_job.title}")
+                        continue
 
+                    pages_before = self._pages_since_recycle
                     try:
                         job = self.extract_job_details(job_card)
                         if job:
                             self.jobs.append(job)
+                            remaining -= 1
+                            if self.scrape_cache:
+                                self.scrape_cache.put(job)
                             self.logger.info(
                                 f"✓ Scraped: {job.company} - {job.title}"
                             )
@@ -250,8 +449,22 @@ class BaseScraper(ABC):
                         self.logger.error(f"Error extracting job: {e}")
                         continue
 
-                    # Rate limiting between jobs
-                    if i < len(job_cards) - 1:
+                    if not pending or remaining <= 0:
+                        continue
+
+                    # Recycling normally waits for the next term boundary. Only while
+                    # extraction is rendering in the page is it done mid-term: card
+                    # handles belong to the page, so that reloads the results and carries
+                    # on with the cards not yet done (needs card IDs)
+                    used_page = self._pages_since_recycle > pages_before
+                    if used_page and card_id and self._pages_since_recycle >= self.config.pages_per_context:
+                        self._recycle_context()
+                        pending = deque(
+                            card for card in self._load_search_results(search_url)
+                            if self._card_id(card) not in done_ids
+                        )
+                    else:
+                        # Rate limiting between jobs
                         self.wait_for_rate_limit()
 
             self.logger.info(f"✓ Scraping complete: {len(self.jobs)} jobs found")
@@ -268,6 +481,21 @@ class BaseScraper(ABC):
             else:
                 self.logger.info("✓ Browser kept open for Phase 2")
 
+    def _cached_job(self, job_card) -> Optional[JobPosting]:
+        """
+        Look up a job card in the scrape cache
+
+        Args:
+            job_card: Job card data (cache lookups need a "job_id" key)
+
+        Returns:
+            Cached JobPosting or None if not cached, stale, or caching is off
+        """
+        card_id = self._card_id(job_card)
+        if not self.scrape_cache or not card_id:
+            return None
+        return self.scrape_cache.get(self.platform_name, card_id, max_age=self.config.scrape_cache_max_age)
+
     def login_if_required(self):
         """
         Login to platform if required
@@ -276,6 +504,14 @@ class BaseScraper(ABC):
         """
         pass
 
+    def on_page_changed(self):
+        """
+        Called after self.page has been replaced (new search page or recycled context)
+
+        Override this method to drop helpers bound to the previous page.
+        """
+        pass
+
     def handle_popup(self):
         """
         Handle popups/modals that might appear
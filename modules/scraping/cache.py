@@ -0,0 +1,117 @@
+"""
+Scrape Cache
+
+Persistent store of extracted job details, keyed by platform and job ID.
+Jobs seen on an earlier run are loaded from SQLite instead of being re-scraped.
+"""
+
+import time
+import sqlite3
+import logging
+from pathlib import Path
+from typing import Optional
+
+from modules.scraping.job_models import JobPosting
+from modules.utils.helpers import json_loads, json_dumps_bytes
+
+
+class ScrapeCache:
+    """
+    SQLite cache of scraped JobPostings
+
+    Table structure:
+        platform    Platform name
+        job_id      Platform job ID
+        payload     JobPosting.to_dict() as JSON
+        scraped_at  Unix time the job was stored (checked against max_age)
+    """
+
+    def __init__(self, path: str = "workspace/.scrape_cache.db"):
+        """
+        Initialize scrape cache
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+
+        # Autocommit: every put is a single statement
+        self._conn = sqlite3.connect(str(self.path), isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                platform TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                scraped_at REAL NOT NULL,
+                PRIMARY KEY (platform, job_id)
+            )
+            """
+        )
+
+    def get(self, platform: str, job_id: str, max_age: Optional[float] = None) -> Optional[JobPosting]:
+        """
+        Get a cached job
+
+        Args:
+            platform: Platform name
+            job_id: Platform job ID
+            max_age: Seconds after which a cached job is treated as missing (None = never)
+
+        Returns:
+            JobPosting or None if missing or too old
+        """
+        try:
+            row = self._conn.execute(
+                "SELECT payload, scraped_at FROM jobs WHERE platform = ? AND job_id = ?",
+                (platform, job_id),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error reading scrape cache: {e}")
+            return None
+
+        if row is None:
+            return None
+        if max_age is not None and time.time() - row[1] > max_age:
+            return None
+
+        try:
+            return JobPosting.from_dict(json_loads(row[0]))
+        except (ValueError, TypeError) as e:
+            self.logger.debug(f"Discarding unreadable cached job {platform}/{job_id}: {e}")
+            return None
+
+    def put(self, job: JobPosting):
+        """
+        Store a scraped job
+
+        Args:
+            job: Job to cache (keyed by job.platform and job.job_id)
+        """
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (platform, job_id, payload, scraped_at) VALUES (?, ?, ?, ?)",
+                (job.platform, job.job_id, json_dumps_bytes(job.to_dict()), time.time()),
+            )
+        except sqlite3.Error as e:
+            self.logger.error(f"Error writing scrape cache: {e}")
+
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
+
+
+# Global cache instance
+_scrape_cache = None
+
+
+def get_scrape_cache() -> ScrapeCache:
+    """Get global ScrapeCache instance"""
+    global _scrape_cache
+    if _scrape_cache is None:
+        _scrape_cache = ScrapeCache()
+    return _scrape_cache
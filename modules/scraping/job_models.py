@@ -4,12 +4,12 @@ Job Data Models
 Defines data structures for job information
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class JobPosting:
     """Represents a job posting"""
 
@@ -54,29 +54,16 @@ class JobPosting:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {
-            "job_id": self.job_id,
-            "platform": self.platform,
-            "company": self.company,
-            "title": self.title,
-            "location": self.location,
-            "job_url": self.job_url,
-            "description": self.description,
-            "requirements": self.requirements,
-            "salary": self.salary,
-            "posted_date": self.posted_date,
-            "application_deadline": self.application_deadline,
-            "job_type": self.job_type,
-            "work_model": self.work_model,
-            "keywords": self.keywords,
-            "required_skills": self.required_skills,
-            "visa_sponsorship": self.visa_sponsorship,
-            "easy_apply": self.easy_apply,
-            "external_apply": self.external_apply,
-            "application_url": self.application_url,
-            "scraped_at": self.scraped_at.isoformat(),
-            "raw_data": self.raw_data,
-        }
+        data = {name: getattr(self, name) for name in _JOB_POSTING_FIELDS}
+        data["scraped_at"] = self.scraped_at.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobPosting":
+        """Create from a to_dict() dictionary"""
+        data = dict(data)
+        data["scraped_at"] = datetime.fromisoformat(data["scraped_at"])
+        return cls(**data)
 
     @property
     def is_recent(self) -> bool:
@@ -95,7 +82,7 @@ class JobPosting:
         return self.description[:500] + "..."
 
 
-@dataclass
+@dataclass(slots=True)
 class ScraperConfig:
     """Configuration for job scraper"""
 
@@ -126,21 +113,20 @@ class ScraperConfig:
     # Browser settings
     headless: bool = False
     timeout: int = 30000  # milliseconds
+    user_data_dir: Optional[str] = None  # Chromium profile dir (overrides workspace/.browser_sessions)
+    storage_state_path: Optional[str] = None  # Cookies/localStorage JSON for non-persistent contexts
+    save_screenshots: bool = False  # Debug: keep vision-fallback card screenshots on disk
+    vision_fallback: bool = True  # Screenshot cards for the vision model when text extraction fails
+    block_resources: bool = True  # Abort font/media (and image, without vision fallback) requests
+    pages_per_context: int = 25  # Recycle the browser context after this many details rendered in it
+    use_scrape_cache: bool = True  # Reuse job details scraped on earlier runs
+    scrape_cache_max_age: Optional[int] = 7 * 24 * 3600  # seconds, None = never re-scrape
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {
-            "search_terms": self.search_terms,
-            "location": self.location,
-            "radius": self.radius,
-            "date_posted": self.date_posted,
-            "experience_level": self.experience_level,
-            "job_type": self.job_type,
-            "work_model": self.work_model,
-            "easy_apply_only": self.easy_apply_only,
-            "visa_sponsorship": self.visa_sponsorship,
-            "sort_by": self.sort_by,
-            "max_results": self.max_results,
-            "headless": self.headless,
-            "timeout": self.timeout,
-        }
+        return {name: getattr(self, name) for name in _SCRAPER_CONFIG_FIELDS}
+
+
+# Field names, resolved once for to_dict
+_JOB_POSTING_FIELDS = tuple(f.name for f in fields(JobPosting))
+_SCRAPER_CONFIG_FIELDS = tuple(f.name for f in fields(ScraperConfig))
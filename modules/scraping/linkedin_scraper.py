@@ -4,20 +4,393 @@ LinkedIn Job Scraper
 Scrapes job postings from LinkedIn Jobs with vision-based fallback for company extraction
 """
 
-from typing import List, Optional
+from typing import List, Optional, Dict, Tuple
 import re
 import time
 import os
 import random
+import io
+import hashlib
+from datetime import datetime, timedelta
+from functools import lru_cache
 from urllib.parse import urlencode
 from pathlib import Path
 
+from bs4 import BeautifulSoup
+from PIL import Image
+
 from modules.scraping.base_scraper import BaseScraper
 from modules.scraping.job_models import JobPosting, ScraperConfig
-from modules.utils.helpers import generate_job_id, extract_keywords, clean_text, human_delay, human_scroll_delay
+from modules.utils.helpers import json_loads, generate_job_id, extract_keywords, clean_text, human_delay, human_scroll_delay
 from modules.generation.ollama_client import get_ollama_client
 from modules.automation.adaptive_scraper import get_adaptive_scraper
 
+# Guest endpoint serving a job posting's HTML (description, criteria, apply button)
+_GUEST_POSTING_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+
+# "3 days ago" / "3d" style posting dates (matched against lowercased text); the unit
+# is dispatched on its prefix, with "min" and "mo" tried before the bare "m" of "5m"
+_RELATIVE_DATE_RE = re.compile(r"(\d+)\s*(min|mo|h|d|w|m)")
+_DATE_UNITS = {
+    "min": timedelta(minutes=1),
+    "m": timedelta(minutes=1),
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "w": timedelta(weeks=1),
+    "mo": timedelta(days=30),  # Approximate
+}
+
+# Search results list containers, any of which means the results have rendered
+_CONTAINER_SELECTOR = ", ".join((
+    "ul.jobs-search__results-list",
+    "ul.scaffold-layout__list-container",
+    "ul[data-testid='job-search-results-list']",
+    "div.jobs-search-results-list",
+    "div.scaffold-layout__list-container",
+    "ol.jobs-search-results__list",
+    "ul.artdeco-list",
+))
+
+# Close buttons of banners/modals that can cover job cards
+_BANNER_SELECTORS = (
+    'button[aria-label="Dismiss"]',
+    'button[data-control-name*="dismiss"]',
+    'button.modal__dismiss',
+    'button[data-test-modal-close-btn]',
+    'button.artdeco-modal__dismiss',
+    'button[aria-label="Close"]',
+    'button.msg-overlay-bubble-header__controls button',
+    'button[data-tracking-control-name="cookie_consent"]',
+    'button[action-type="DENY"]',
+)
+
+# Runs in the page: clicks every visible banner close button, returns the selectors used
+_DISMISS_BANNERS_JS = """
+selectors => selectors.filter(selector => {
+    const el = document.querySelector(selector);
+    if (!el) return false;
+    const rect = el.getBoundingClientRect();
+    if (rect.width === 0 || rect.height === 0 || getComputedStyle(el).visibility === "hidden") return false;
+    el.click();
+    return true;
+})
+"""
+
+# Job card field selectors, most specific first (cached adaptive selectors are tried before these)
+_LINK_SELECTORS = (
+    "a.base-card__full-link",
+    "a[data-control-id*='jobPosting']",
+    "a[href*='/jobs/view/']",
+    "a.job-card-container__link",
+    "a.job-card-list__title",
+)
+_TITLE_SELECTORS = (
+    "h3.base-search-card__title",
+    "h3.job-card-list__title",
+    "h2.job-search-card__title",
+    "span.job-search-card__title",
+    "a[data-tracking-control-name='job-card-title']",
+    ".job-card-search__title",
+    "h3.job-card-container__title",
+    "h4.base-search-card__title",
+    "span.job-card-container__link",
+)
+_COMPANY_SELECTORS = (
+    "h4.base-search-card__subtitle",
+    "h4.job-card-container__company-name",
+    "span.job-card-container__primary-description",
+    "a[data-tracking-control-name='job-card-company']",
+    ".job-card-search__company",
+    "h4.job-card-container__metadata",
+    "span.job-card-container__metadata",
+    "a.base-search-card__subtitle-link",
+)
+_LOCATION_SELECTORS = (
+    "span.job-search-card__location",
+    "span.job-card-container__metadata-item",
+    "li.job-card-container__metadata-item",
+    ".job-card-search__location",
+    "span.job-card-container__bullet",
+    "div.job-card-container__metadata-wrapper span",
+)
+
+# Per-field unions for the adaptive fallback: one query per field on a card the bulk
+# read missed, instead of one per selector (first match in document order is fine there)
+_TITLE_SELECTOR_UNION = ", ".join(_TITLE_SELECTORS)
+_COMPANY_SELECTOR_UNION = ", ".join(_COMPANY_SELECTORS)
+_LOCATION_SELECTOR_UNION = ", ".join(_LOCATION_SELECTORS)
+
+# Job card selectors, most specific first
+_CARD_SELECTORS = (
+    "li.jobs-search-results__list-item",
+    "li[data-testid='job-search-result']",
+    "li.occludable-update",
+    "li.reusable-search__result-container",
+    "div.job-search-card",
+    "div.job-card-container",
+    "li[data-entity-urn*='jobPosting']",
+    "div.base-card",
+)
+
+# Runs in the page: first selector in the list that matches anything
+_FIRST_MATCHING_SELECTOR_JS = "selectors => selectors.find(s => document.querySelector(s)) || null"
+
+# Location keywords for the raw card text fallback
+_LOCATION_RE = re.compile(
+    r"\b(?:london|uk|united kingdom|remote|hybrid|cambridge|manchester|edinburgh)\b", re.IGNORECASE
+)
+
+# Numeric job ID at the start of the path after /jobs/view/
+_JOB_ID_RE = re.compile(r"\d+")
+
+# Runs in the page over every job card: first non-empty match per selector list
+_CARD_FIELDS_JS = """
+(cards, selectors) => cards.map(card => {
+    const text = list => {
+        for (const selector of list) {
+            const el = card.querySelector(selector);
+            const value = el && el.innerText.trim();
+            if (value) return value;
+        }
+        return null;
+    };
+    let href = null;
+    for (const selector of selectors.link) {
+        const link = card.querySelector(selector);
+        if (link) { href = link.getAttribute("href"); break; }
+    }
+    if (!href) {
+        const link = Array.from(card.querySelectorAll("a"))
+            .find(a => (a.getAttribute("href") || "").includes("/jobs/view/"));
+        href = link ? link.getAttribute("href") : null;
+    }
+    return {
+        href,
+        title: text(selectors.title),
+        company: text(selectors.company),
+        location: text(selectors.location),
+    };
+})
+"""
+
+# Detail-panel selectors, most specific first
+_DESCRIPTION_SELECTORS = (
+    'div.description__text',
+    'div.show-more-less-html__markup',
+    'div[class*="description__text"]',
+    'div.jobs-description__content',
+    'div.jobs-box__html-content',
+    'section[class*="description"]',
+    'div[data-test-id*="description"]',
+    'div.jobs-description',
+    'article.jobs-description__container',
+)
+_CRITERIA_SELECTORS = (
+    "li.description__job-criteria-item",
+    "li.jobs-description__list-item",
+    "li[class*='job-criteria']",
+)
+_EASY_APPLY_SELECTOR = ", ".join((
+    "button.jobs-apply-button",
+    "button[aria-label*='Easy Apply']",
+    "button[data-control-name*='easy_apply']",
+))
+
+# Runs in the page: text of the first visible description with more than 50 characters
+_DESCRIPTION_TEXT_JS = """
+selectors => {
+    for (const selector of selectors) {
+        const el = document.querySelector(selector);
+        if (!el) continue;
+        const rect = el.getBoundingClientRect();
+        if (rect.width === 0 || rect.height === 0 || getComputedStyle(el).visibility === "hidden") continue;
+        const text = el.innerText.trim();
+        if (text.length > 50) return text;
+    }
+    return false;
+}
+"""
+
+# Runs in the page over the criteria items: [header, value] pairs
+_CRITERIA_JS = """
+items => items.map(item => {
+    const header = item.querySelector("h3");
+    const value = item.querySelector("span");
+    return header && value ? [header.innerText.trim(), value.innerText.trim()] : null;
+}).filter(Boolean)
+"""
+
+# Same visibility test as ElementHandle.is_visible(), over every match at once
+_ANY_VISIBLE_JS = """
+els => els.some(el => {
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== "hidden";
+})
+"""
+
+# Runs in the page: text of every JSON-LD block
+_JSON_LD_JS = """
+() => Array.from(document.querySelectorAll('script[type="application/ld+json"]'), s => s.textContent)
+"""
+
+
+def _job_posting_companies(blocks: List[str]) -> Dict[str, str]:
+    """
+    Map job ID to hiring company from schema.org JobPosting JSON-LD blocks
+
+    Args:
+        blocks: JSON-LD script texts
+
+    Returns:
+        Dict of job ID -> company name (IDs from identifier or the /jobs/view/ URL)
+    """
+    companies = {}
+    pending = []
+    for block in blocks:
+        try:
+            pending.append(json_loads(block))
+        except ValueError:
+            continue
+
+    while pending:
+        node = pending.pop()
+        if isinstance(node, list):
+            pending.extend(node)
+            continue
+        if not isinstance(node, dict):
+            continue
+        pending.extend(node.get("@graph") or [])
+        if node.get("@type") != "JobPosting":
+            continue
+
+        organization = node.get("hiringOrganization")
+        company = organization.get("name") if isinstance(organization, dict) else organization
+        if not isinstance(company, str) or not company.strip():
+            continue
+
+        identifier = node.get("identifier")
+        if isinstance(identifier, dict):
+            identifier = identifier.get("value")
+        job_id = str(identifier) if isinstance(identifier, (str, int)) and str(identifier).isdigit() else None
+        if job_id is None:
+            _, found, job_path = str(node.get("url") or "").partition("/jobs/view/")
+            match = _JOB_ID_RE.match(job_path) if found else None
+            job_id = match.group() if match else None
+        if job_id:
+            companies[job_id] = company.strip()
+
+    return companies
+
+
+# LinkedIn experience level codes: 1=Internship, 2=Entry, 3=Associate, 4=Mid-Senior, 5=Director, 6=Executive
+_EXPERIENCE_CODES = {
+    "Internship": "1",
+    "Entry level": "2",
+    "Associate": "3",
+    "Mid-Senior level": "4",
+    "Director": "5",
+    "Executive": "6",
+}
+
+# LinkedIn job type codes: F=Full-time, P=Part-time, C=Contract, T=Temporary, I=Internship
+_JOB_TYPE_CODES = {
+    "Full-time": "F",
+    "Part-time": "P",
+    "Contract": "C",
+    "Temporary": "T",
+    "Internship": "I",
+}
+
+# LinkedIn work model codes: 1=On-site, 2=Remote, 3=Hybrid
+_WORK_MODEL_CODES = {
+    "On-site": "1",
+    "Remote": "2",
+    "Hybrid": "3",
+}
+
+
+@lru_cache(maxsize=64)
+def _search_url(
+    base_url: str,
+    search_term: str,
+    location: str,
+    experience_level: Tuple[str, ...],
+    job_type: Tuple[str, ...],
+    work_model: Tuple[str, ...],
+    easy_apply_only: bool,
+) -> str:
+    """
+    Build a LinkedIn search URL (memoized, so retries of a term reuse it)
+
+    Args:
+        base_url: LinkedIn jobs search base URL
+        search_term: Job search term
+        location: Search location
+        experience_level: Experience level filter names
+        job_type: Job type filter names
+        work_model: Work model filter names
+        easy_apply_only: Only Easy Apply jobs
+
+    Returns:
+        Full search URL
+    """
+    params = {
+        "keywords": search_term,
+        "location": location,
+        "f_TPR": "r604800",  # Past week (7 days in seconds)
+        "sortBy": "DD",  # Sort by date (most recent)
+    }
+
+    if experience_level:
+        params["f_E"] = ",".join(_EXPERIENCE_CODES.get(level, "2") for level in experience_level)
+
+    if job_type:
+        params["f_JT"] = ",".join(_JOB_TYPE_CODES.get(jt, "F") for jt in job_type)
+
+    if work_model:
+        params["f_WT"] = ",".join(_WORK_MODEL_CODES.get(wm, "1") for wm in work_model)
+
+    # Easy apply filter
+    if easy_apply_only:
+        params["f_AL"] = "true"
+
+    return f"{base_url}/?{urlencode(params)}"
+
+
+# Leading "1." / "2)" numbering the vision model may put on batch answers
+_NUMBERED_LINE_RE = re.compile(r"^\s*\d+\s*[.):-]\s*")
+
+# Lead-ins the vision model puts before the company name ("Company name: The company is X")
+_VISION_CLEAN_RE = re.compile(r"^\s*(?:(?:company name:|the company is|is\b)\s*)+", re.IGNORECASE)
+
+# Blank rows between stacked card screenshots so the model sees separate cards
+_STACK_GAP = 16
+
+
+def _stack_images(images: List[bytes]) -> bytes:
+    """
+    Tile PNG screenshots vertically into one PNG
+
+    Args:
+        images: PNG bytes, top to bottom
+
+    Returns:
+        PNG bytes of the collage
+    """
+    tiles = [Image.open(io.BytesIO(data)).convert("RGB") for data in images]
+    width = max(tile.width for tile in tiles)
+    height = sum(tile.height for tile in tiles) + _STACK_GAP * (len(tiles) - 1)
+
+    collage = Image.new("RGB", (width, height), "white")
+    y_offset = 0
+    for tile in tiles:
+        collage.paste(tile, (0, y_offset))
+        y_offset += tile.height + _STACK_GAP
+
+    buffer = io.BytesIO()
+    collage.save(buffer, format="PNG")
+    return buffer.getvalue()
+
 
 class LinkedInScraper(BaseScraper):
     """Scraper for LinkedIn Jobs with vision-based fallback"""
@@ -27,11 +400,19 @@ class LinkedInScraper(BaseScraper):
         super().__init__(config)
         self.ollama = get_ollama_client()
         self.screenshot_dir = Path("workspace/screenshots")
-        self.screenshot_dir.mkdir(parents=True, exist_ok=True)
+        # Vision answers by screenshot digest: a card seen again (e.g. the same job
+        # under another search term) doesn't go back to the model
+        self._vision_cache: Dict[str, str] = {}
+        if config.save_screenshots:
+            self.screenshot_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize adaptive scraper (will be available after browser starts)
         self.adaptive_scraper = None
 
+    def on_page_changed(self):
+        """Rebuild the adaptive scraper on the next card extraction (it is bound to the old page)"""
+        self.adaptive_scraper = None
+
     @property
     def platform_name(self) -> str:
         return "linkedin"
@@ -42,58 +423,15 @@ class LinkedInScraper(BaseScraper):
 
     def build_search_url(self, search_term: str) -> str:
         """Build LinkedIn search URL with filters"""
-
-        params = {
-            "keywords": search_term,
-            "location": self.config.location or "United Kingdom",
-            "f_TPR": "r604800",  # Past week (7 days in seconds)
-            "sortBy": "DD",  # Sort by date (most recent)
-        }
-
-        # Add experience level filter if specified
-        if self.config.experience_level:
-            # LinkedIn experience level codes: 1=Internship, 2=Entry, 3=Associate, 4=Mid-Senior, 5=Director, 6=Executive
-            experience_map = {
-                "Internship": "1",
-                "Entry level": "2",
-                "Associate": "3",
-                "Mid-Senior level": "4",
-                "Director": "5",
-                "Executive": "6",
-            }
-            codes = [experience_map.get(level, "2") for level in self.config.experience_level]
-            params["f_E"] = ",".join(codes)
-
-        # Add job type filter if specified
-        if self.config.job_type:
-            # LinkedIn job type codes: F=Full-time, P=Part-time, C=Contract, T=Temporary, I=Internship
-            job_type_map = {
-                "Full-time": "F",
-                "Part-time": "P",
-                "Contract": "C",
-                "Temporary": "T",
-                "Internship": "I",
-            }
-            codes = [job_type_map.get(jt, "F") for jt in self.config.job_type]
-            params["f_JT"] = ",".join(codes)
-
-        # Add work model filter if specified
-        if self.config.work_model:
-            # LinkedIn work model codes: 1=On-site, 2=Remote, 3=Hybrid
-            work_model_map = {
-                "On-site": "1",
-                "Remote": "2",
-                "Hybrid": "3",
-            }
-            codes = [work_model_map.get(wm, "1") for wm in self.config.work_model]
-            params["f_WT"] = ",".join(codes)
-
-        # Easy apply filter
-        if self.config.easy_apply_only:
-            params["f_AL"] = "true"
-
-        url = f"{self.base_url}/?{urlencode(params)}"
-        return url
+        return _search_url(
+            self.base_url,
+            search_term,
+            self.config.location or "United Kingdom",
+            tuple(self.config.experience_level or ()),
+            tuple(self.config.job_type or ()),
+            tuple(self.config.work_model or ()),
+            self.config.easy_apply_only,
+        )
 
     def _human_like_scroll(self, scroll_amount: int = None, pause: bool = True):
         """
@@ -124,27 +462,15 @@ class LinkedInScraper(BaseScraper):
         """
         Dismiss any LinkedIn banners/modals that might interfere with interactions
         """
-        banner_selectors = [
-            'button[aria-label="Dismiss"]',
-            'button[data-control-name*="dismiss"]',
-            'button.modal__dismiss',
-            'button[data-test-modal-close-btn]',
-            'button.artdeco-modal__dismiss',
-            'button[aria-label="Close"]',
-            'button.msg-overlay-bubble-header__controls button',
-            'button[data-tracking-control-name="cookie_consent"]',
-            'button[action-type="DENY"]',
-        ]
-
-        for selector in banner_selectors:
-            try:
-                banner = self.page.query_selector(selector)
-                if banner and banner.is_visible():
-                    banner.click()
-                    self.logger.debug(f"Dismissed banner with selector: {selector}")
-                    human_delay(0.5, 1.0)
-            except:
-                continue
+        try:
+            dismissed = self.page.evaluate(_DISMISS_BANNERS_JS, list(_BANNER_SELECTORS))
+        except Exception as e:
+            self.logger.debug(f"Banner dismissal failed: {e}")
+            return
+
+        if dismissed:
+            self.logger.debug(f"Dismissed banners with selectors: {', '.join(dismissed)}")
+            human_delay(0.5, 1.0)
 
     def _parse_linkedin_date(self, date_text: str):
         """
@@ -156,8 +482,6 @@ class LinkedInScraper(BaseScraper):
         Returns:
             datetime object or None if parsing fails
         """
-        from datetime import datetime, timedelta
-
         try:
             date_text = date_text.lower().strip()
             now = datetime.now()
@@ -166,33 +490,10 @@ class LinkedInScraper(BaseScraper):
             if 'just now' in date_text or 'today' in date_text:
                 return now
 
-            # Parse "X days ago"
-            if 'day' in date_text:
-                match = re.search(r'(\d+)\s*day', date_text)
-                if match:
-                    days = int(match.group(1))
-                    return now - timedelta(days=days)
-
-            # Parse "X weeks ago"
-            if 'week' in date_text:
-                match = re.search(r'(\d+)\s*week', date_text)
-                if match:
-                    weeks = int(match.group(1))
-                    return now - timedelta(weeks=weeks)
-
-            # Parse "X months ago"
-            if 'month' in date_text:
-                match = re.search(r'(\d+)\s*month', date_text)
-                if match:
-                    months = int(match.group(1))
-                    return now - timedelta(days=months*30)  # Approximate
-
-            # Parse "X hours ago"
-            if 'hour' in date_text:
-                match = re.search(r'(\d+)\s*hour', date_text)
-                if match:
-                    hours = int(match.group(1))
-                    return now - timedelta(hours=hours)
+            # Parse "X minutes/hours/days/weeks/months ago" (or "Xm/Xh/Xd/Xw/Xmo")
+            match = _RELATIVE_DATE_RE.search(date_text)
+            if match:
+                return now - int(match.group(1)) * _DATE_UNITS[match.group(2)]
 
             # Default to now if can't parse
             return now
@@ -309,131 +610,68 @@ class LinkedInScraper(BaseScraper):
                 self._human_like_scroll(scroll_amount)
                 human_delay(1.0, 2.0)  # Wait for content to load
             
-            # Try multiple selectors for job listings container (LinkedIn changes frequently)
-            container_selectors = [
-                "ul.jobs-search__results-list",
-                "ul.scaffold-layout__list-container",
-                "ul[data-testid='job-search-results-list']",
-                "div.jobs-search-results-list",
-                "div.scaffold-layout__list-container",
-                "ol.jobs-search-results__list",
-                "ul.artdeco-list",
-            ]
-            
-            container_found = False
-            for selector in container_selectors:
-                try:
-                    self.page.wait_for_selector(selector, timeout=5000)
-                    container_found = True
-                    self.logger.debug(f"Found job container with selector: {selector}")
-                    break
-                except:
-                    continue
-            
-            if not container_found:
+            # Wait once for any known job listings container (LinkedIn changes frequently)
+            try:
+                self.page.wait_for_selector(_CONTAINER_SELECTOR, timeout=8000)
+                self.logger.debug("Found job container")
+            except Exception:
                 self.logger.warning("Job listings container not found - trying to continue anyway")
-                # Take a screenshot for debugging
-                screenshot_path = "workspace/screenshots/linkedin_debug.png"
-                self.page.screenshot(path=screenshot_path, full_page=True)
-                self.logger.info(f"Debug screenshot saved to: {screenshot_path}")
-
-            # Try multiple selectors for job cards (LinkedIn uses various class names)
-            job_card_selectors = [
-                "li.jobs-search-results__list-item",
-                "li[data-testid='job-search-result']",
-                "li.occludable-update",
-                "li.reusable-search__result-container",
-                "div.job-search-card",
-                "div.job-card-container",
-                "li[data-entity-urn*='jobPosting']",
-                "div.base-card",
-            ]
-            
+                # Full-page screenshots are slow and large, so only when debugging
+                if self.config.save_screenshots or os.getenv("LINKEDIN_DEBUG"):
+                    screenshot_path = self.screenshot_dir / f"linkedin_debug_{datetime.now():%Y%m%d_%H%M%S}.png"
+                    self.page.screenshot(path=str(screenshot_path), full_page=True)
+                    self.logger.info(f"Debug screenshot saved to: {screenshot_path}")
+
+            # First card selector (in priority order) with matches, found in one round-trip;
+            # the selectors overlap (an li card wraps a div.base-card), so they aren't unioned
             job_cards = []
-            for selector in job_card_selectors:
-                try:
-                    cards = self.page.query_selector_all(selector)
-                    if len(cards) > 0:
-                        job_cards = cards
-                        self.logger.debug(f"Found {len(job_cards)} job cards with selector: {selector}")
-                        break
-                except Exception as e:
-                    self.logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+            card_selector = None
+            try:
+                card_selector = self.page.evaluate(_FIRST_MATCHING_SELECTOR_JS, list(_CARD_SELECTORS))
+                if card_selector:
+                    job_cards = self.page.query_selector_all(card_selector)
+                    self.logger.debug(f"Found {len(job_cards)} job cards with selector: {card_selector}")
+            except Exception as e:
+                self.logger.debug(f"Job card lookup failed: {e}")
 
             self.logger.debug(f"Found {len(job_cards)} job card elements")
 
             # Extract basic info from each card
             jobs_data = []
-            link_selectors = [
-                "a.base-card__full-link",
-                "a[data-control-id*='jobPosting']",
-                "a[href*='/jobs/view/']",
-                "a.job-card-container__link",
-                "a.job-card-list__title",
-            ]
-            
-            # More comprehensive selectors (LinkedIn changes structure frequently)
-            title_selectors = [
-                "h3.base-search-card__title",
-                "h3.job-card-list__title",
-                "h2.job-search-card__title",
-                "span.job-search-card__title",
-                "a[data-tracking-control-name='job-card-title']",
-                ".job-card-search__title",
-                "h3.job-card-container__title",
-                "h4.base-search-card__title",
-                "span.job-card-container__link",
-            ]
-            
-            company_selectors = [
-                "h4.base-search-card__subtitle",
-                "h4.job-card-container__company-name",
-                "span.job-card-container__primary-description",
-                "a[data-tracking-control-name='job-card-company']",
-                ".job-card-search__company",
-                "h4.job-card-container__metadata",
-                "span.job-card-container__metadata",
-                "a.base-search-card__subtitle-link",
-            ]
-            
-            location_selectors = [
-                "span.job-search-card__location",
-                "span.job-card-container__metadata-item",
-                "li.job-card-container__metadata-item",
-                ".job-card-search__location",
-                "span.job-card-container__bullet",
-                "div.job-card-container__metadata-wrapper span",
-            ]
-            
-            for card in job_cards:
+
+            # Read link/title/company/location for every card in one renderer round-trip
+            # (cached selectors first); only fields it misses go through the adaptive scraper
+            def with_cached(field_type: str, selectors: Tuple[str, ...]) -> List[str]:
+                cached = self.adaptive_scraper.cache.get(self.platform_name, field_type)
+                return [cached, *selectors] if cached else list(selectors)
+
+            card_fields = []
+            if card_selector:
                 try:
-                    # Extract job URL and ID - try multiple selectors
-                    link = None
-                    for link_selector in link_selectors:
-                        try:
-                            link = card.query_selector(link_selector)
-                            if link:
-                                break
-                        except:
-                            continue
-                    
-                    # Try getting link from card directly if selectors failed
-                    if not link:
-                        # Try finding any link in the card
-                        all_links = card.query_selector_all("a")
-                        for l in all_links:
-                            href = l.get_attribute("href")
-                            if href and "/jobs/view/" in href:
-                                link = l
-                                break
-                    
-                    if not link:
-                        self.logger.debug("Could not find job link in card")
-                        continue
+                    card_fields = self.page.eval_on_selector_all(card_selector, _CARD_FIELDS_JS, {
+                        "link": list(_LINK_SELECTORS),
+                        "title": with_cached("title", _TITLE_SELECTORS),
+                        "company": with_cached("company", _COMPANY_SELECTORS),
+                        "location": with_cached("location", _LOCATION_SELECTORS),
+                    })
+                except Exception as e:
+                    self.logger.debug(f"Bulk card extraction failed: {e}")
+            if len(card_fields) != len(job_cards):
+                card_fields = [{}] * len(job_cards)
+
+            # Company names LinkedIn publishes as JobPosting JSON-LD beat any selector or vision guess
+            try:
+                ld_companies = _job_posting_companies(self.page.evaluate(_JSON_LD_JS)) if job_cards else {}
+            except Exception as e:
+                self.logger.debug(f"JSON-LD extraction failed: {e}")
+                ld_companies = {}
 
-                    job_url = link.get_attribute("href")
+            vision_pending = []
+            for card, fields in zip(job_cards, card_fields):
+                try:
+                    job_url = fields.get("href")
                     if not job_url:
+                        self.logger.debug("Could not find job link in card")
                         continue
                     
                     # Make sure URL is absolute
@@ -441,40 +679,42 @@ class LinkedInScraper(BaseScraper):
                         job_url = f"https://www.linkedin.com{job_url}"
 
                     # Extract job ID from URL
-                    job_id_match = re.search(r"/jobs/view/(\d+)", job_url)
+                    _, found, job_path = job_url.partition("/jobs/view/")
+                    job_id_match = _JOB_ID_RE.match(job_path) if found else None
                     if not job_id_match:
                         self.logger.debug(f"Could not extract job ID from URL: {job_url}")
                         continue
 
-                    job_id = job_id_match.group(1)
+                    job_id = job_id_match.group()
 
                     # Use adaptive scraper to extract fields
                     # It will try cached selectors first, then auto-discover if needed
-                    title_text = self.adaptive_scraper.extract_field(
+                    title_text = fields.get("title") or self.adaptive_scraper.extract_field(
                         card,
                         "title",
-                        multiple_selectors=title_selectors
+                        multiple_selectors=[_TITLE_SELECTOR_UNION]
                     )
 
-                    company_text = self.adaptive_scraper.extract_field(
+                    company_text = ld_companies.get(job_id) or fields.get("company") or self.adaptive_scraper.extract_field(
                         card,
                         "company",
-                        multiple_selectors=company_selectors
+                        multiple_selectors=[_COMPANY_SELECTOR_UNION]
                     )
 
-                    location_text = self.adaptive_scraper.extract_field(
+                    location_text = fields.get("location") or self.adaptive_scraper.extract_field(
                         card,
                         "location",
-                        multiple_selectors=location_selectors
+                        multiple_selectors=[_LOCATION_SELECTOR_UNION]
                     )
 
                     # Extract company name with vision fallback
                     company_name = company_text if company_text else "Unknown"
 
-                    # If text extraction failed, use vision model
-                    if not company_name or company_name == "Unknown" or len(company_name) < 2:
-                        self.logger.info(f"Text extraction failed for company, trying vision...")
-                        company_name = self._extract_company_with_vision(card, job_id)
+                    # If text extraction failed, queue the card for the vision model
+                    if self.config.vision_fallback and (
+                        not company_name or company_name == "Unknown" or len(company_name) < 2
+                    ):
+                        vision_pending.append(len(jobs_data))
 
                     jobs_data.append({
                         "job_id": job_id,
@@ -491,6 +731,15 @@ class LinkedInScraper(BaseScraper):
                     self.logger.warning(f"Error extracting job card: {e}")
                     continue
 
+            # One vision call for every card whose company text extraction failed
+            if vision_pending:
+                self.logger.info(f"Text extraction failed for {len(vision_pending)} companies, trying vision...")
+                companies = self._extract_companies_with_vision(
+                    [(jobs_data[i]["card_element"], jobs_data[i]["job_id"]) for i in vision_pending]
+                )
+                for i, company_name in zip(vision_pending, companies):
+                    jobs_data[i]["company"] = company_name
+
             # Print cache statistics
             if self.adaptive_scraper:
                 self.adaptive_scraper.print_cache_stats()
@@ -501,23 +750,72 @@ class LinkedInScraper(BaseScraper):
             self.logger.error(f"Error extracting job cards: {e}")
             return []
 
-    def _extract_company_with_vision(self, card_element, job_id: str) -> str:
+    def _screenshot_card(self, card_element, job_id: str) -> bytes:
         """
-        Extract company name from job card using vision model.
+        Screenshot a job card in memory (written to disk only when save_screenshots is on)
 
         Args:
             card_element: Playwright element handle for job card
             job_id: Job ID for screenshot naming
 
+        Returns:
+            PNG bytes
+        """
+        png_bytes = card_element.screenshot()
+        if self.config.save_screenshots:
+            screenshot_path = self.screenshot_dir / f"job_card_{job_id}.png"
+            screenshot_path.write_bytes(png_bytes)
+            self.logger.debug(f"Screenshot saved: {screenshot_path}")
+        return png_bytes
+
+    @staticmethod
+    def _vision_key(png_bytes: bytes) -> str:
+        """Cheap digest of a card screenshot for the vision answer cache"""
+        return hashlib.blake2b(png_bytes, digest_size=8).hexdigest()
+
+    def _clean_vision_company(self, company_name: str) -> str:
+        """
+        Clean a company name returned by the vision model
+
+        Args:
+            company_name: Raw model answer for one card
+
+        Returns:
+            Company name or "Unknown" if it doesn't look like one
+        """
+        # Remove common prefixes from LLM response
+        company_name = _VISION_CLEAN_RE.sub("", company_name).strip()
+
+        # Validate it's not too long (company names shouldn't be > 100 chars)
+        if len(company_name) > 100:
+            self.logger.warning(f"Vision extracted name too long: {company_name[:100]}...")
+            return "Unknown"
+
+        # Validate it's not empty after cleaning
+        if len(company_name) < 2:
+            return "Unknown"
+
+        return company_name
+
+    def _extract_company_with_vision(self, card_element, job_id: str, png_bytes: Optional[bytes] = None) -> str:
+        """
+        Extract company name from job card using vision model.
+
+        Args:
+            card_element: Playwright element handle for job card
+            job_id: Job ID for screenshot naming (when save_screenshots is on)
+            png_bytes: Screenshot already taken of the card (taken here if None)
+
         Returns:
             Company name or "Unknown" if extraction fails
         """
         try:
-            # Take screenshot of the job card
-            screenshot_path = self.screenshot_dir / f"job_card_{job_id}.png"
-            card_element.screenshot(path=str(screenshot_path))
+            if png_bytes is None:
+                png_bytes = self._screenshot_card(card_element, job_id)
 
-            self.logger.debug(f"Screenshot saved: {screenshot_path}")
+            image_key = self._vision_key(png_bytes)
+            if image_key in self._vision_cache:
+                return self._vision_cache[image_key]
 
             # Prompt for vision model
             prompt = """Look at this LinkedIn job posting card. Extract ONLY the company name.
@@ -531,28 +829,16 @@ Company name:"""
 
             # Use vision model to extract company name
             company_name = self.ollama.analyze_image(
-                image_path=str(screenshot_path),
-                prompt=prompt
+                image_path=None,
+                prompt=prompt,
+                image_bytes=png_bytes
             )
 
             if company_name:
-                # Clean up the response
-                company_name = company_name.strip()
-                # Remove common prefixes from LLM response
-                company_name = company_name.replace("Company name:", "").strip()
-                company_name = company_name.replace("The company is", "").strip()
-                company_name = company_name.replace("is", "").strip()
-
-                # Validate it's not too long (company names shouldn't be > 100 chars)
-                if len(company_name) > 100:
-                    self.logger.warning(f"Vision extracted name too long: {company_name[:100]}...")
-                    return "Unknown"
-
-                # Validate it's not empty after cleaning
-                if len(company_name) < 2:
-                    return "Unknown"
-
-                self.logger.info(f"✓ Vision extracted company: {company_name}")
+                company_name = self._clean_vision_company(company_name)
+                if company_name != "Unknown":
+                    self._vision_cache[image_key] = company_name
+                    self.logger.info(f"✓ Vision extracted company: {company_name}")
                 return company_name
 
             return "Unknown"
@@ -561,6 +847,85 @@ Company name:"""
             self.logger.warning(f"Vision extraction failed: {e}")
             return "Unknown"
 
+    def _extract_companies_with_vision(self, cards: List[Tuple[object, str]]) -> List[str]:
+        """
+        Extract company names for several job cards with one vision model call
+
+        The card screenshots are stacked top to bottom into a single image and
+        the model answers one line per card. If the answer doesn't have one line
+        per card, each card is asked about on its own.
+
+        Args:
+            cards: (card element, job ID) pairs
+
+        Returns:
+            Company names in the same order ("Unknown" where extraction failed)
+        """
+        if len(cards) == 1:
+            return [self._extract_company_with_vision(*cards[0])]
+
+        screenshots = []
+        for card_element, job_id in cards:
+            try:
+                screenshots.append(self._screenshot_card(card_element, job_id))
+            except Exception as e:
+                self.logger.warning(f"Card screenshot failed: {e}")
+                screenshots.append(None)
+
+        companies = ["Unknown"] * len(cards)
+        captured = []
+        for i, png in enumerate(screenshots):
+            if png is None:
+                continue
+            cached = self._vision_cache.get(self._vision_key(png))
+            if cached:
+                companies[i] = cached
+            else:
+                captured.append(i)
+        if not captured:
+            return companies
+        if len(captured) == 1:
+            i = captured[0]
+            companies[i] = self._extract_company_with_vision(*cards[i], png_bytes=screenshots[i])
+            return companies
+
+        prompt = f"""This image shows {len(captured)} LinkedIn job posting cards stacked top to bottom.
+Extract ONLY the company name from each card.
+
+Rules:
+- Output exactly {len(captured)} lines, one per card, in top-to-bottom order
+- Each line is ONLY the company name, nothing else
+- If you can't find a card's company, write "Unknown" on its line
+
+Company names:"""
+
+        lines = []
+        try:
+            answer = self.ollama.analyze_image(
+                image_path=None,
+                prompt=prompt,
+                image_bytes=_stack_images([screenshots[i] for i in captured])
+            )
+            if answer:
+                lines = [_NUMBERED_LINE_RE.sub("", line) for line in answer.splitlines() if line.strip()]
+        except Exception as e:
+            self.logger.warning(f"Batch vision extraction failed: {e}")
+
+        if len(lines) != len(captured):
+            self.logger.debug(
+                f"Batch vision answer had {len(lines)} lines for {len(captured)} cards, asking per card"
+            )
+            for i in captured:
+                companies[i] = self._extract_company_with_vision(*cards[i], png_bytes=screenshots[i])
+            return companies
+
+        for i, line in zip(captured, lines):
+            companies[i] = self._clean_vision_company(line)
+            if companies[i] != "Unknown":
+                self._vision_cache[self._vision_key(screenshots[i])] = companies[i]
+                self.logger.info(f"✓ Vision extracted company: {companies[i]}")
+        return companies
+
     def _extract_from_text_fallback(self, card_text: str) -> dict:
         """
         Extract company and location from raw card text as last resort
@@ -581,10 +946,8 @@ Company name:"""
                 result['company'] = lines[1][:100]  # Limit length
 
             # Look for location keywords
-            location_keywords = ['london', 'uk', 'united kingdom', 'remote', 'hybrid', 'cambridge', 'manchester', 'edinburgh']
             for line in lines:
-                line_lower = line.lower()
-                if any(keyword in line_lower for keyword in location_keywords):
+                if _LOCATION_RE.search(line):
                     result['location'] = line[:100]
                     break
 
@@ -595,54 +958,31 @@ Company name:"""
 
         return result
 
-    def _extract_description_with_retry(self, max_retries: int = 5) -> str:
+    def _extract_description_with_retry(self, timeout_ms: int = 2500) -> str:
         """
-        Extract job description from detail panel with validation and retries
+        Extract job description from detail panel, waiting for it to render
+
+        The page polls every description selector until one is visible with
+        enough text, so the wait ends as soon as the panel has loaded.
 
         Args:
-            max_retries: Maximum number of retry attempts
+            timeout_ms: How long to wait for the description to appear
 
         Returns:
             Job description text or fallback message
         """
-        description_selectors = [
-            'div.description__text',
-            'div.show-more-less-html__markup',
-            'div[class*="description__text"]',
-            'div.jobs-description__content',
-            'div.jobs-box__html-content',
-            'section[class*="description"]',
-            'div[data-test-id*="description"]',
-            'div.jobs-description',
-            'article.jobs-description__container',
-        ]
-
-        for attempt in range(max_retries):
-            try:
-                # Try each selector
-                for selector in description_selectors:
-                    try:
-                        desc_element = self.page.query_selector(selector)
-                        if desc_element:
-                            # Wait for element to be visible
-                            if desc_element.is_visible():
-                                description = clean_text(desc_element.inner_text())
-
-                                # Validate: description should be at least 50 characters
-                                if len(description.strip()) > 50:
-                                    self.logger.debug(f"Description extracted with selector: {selector}")
-                                    return description
-                    except Exception as e:
-                        self.logger.debug(f"Selector {selector} failed: {e}")
-                        continue
-
-                # If no valid description found, wait and retry
-                if attempt < max_retries - 1:
-                    self.logger.debug(f"Description validation failed, retry {attempt + 1}/{max_retries}")
-                    human_delay(0.3, 0.5)
+        try:
+            handle = self.page.wait_for_function(
+                _DESCRIPTION_TEXT_JS, arg=list(_DESCRIPTION_SELECTORS), timeout=timeout_ms
+            )
+            description = clean_text(handle.json_value())
 
-            except Exception as e:
-                self.logger.debug(f"Description extraction attempt {attempt + 1} failed: {e}")
+            # Validate: description should be at least 50 characters
+            if len(description) > 50:
+                self.logger.debug("Description extracted from detail panel")
+                return description
+        except Exception as e:
+            self.logger.debug(f"Description did not appear within {timeout_ms}ms: {e}")
 
         # Final fallback: try to get ANY text from the detail panel
         try:
@@ -658,81 +998,132 @@ Company name:"""
         self.logger.warning("Could not extract job description")
         return "Description not available"
 
-    def extract_job_details(self, job_card_data: dict) -> Optional[JobPosting]:
-        """
-        Extract detailed job information by expanding the job panel
-        (Panel-based approach - no page navigation)
+    def _fetch_guest_job_posting(self, job_id: str) -> Optional[Tuple[str, Dict[str, str], bool]]:
         """
+        Fetch description, criteria and Easy Apply flag from LinkedIn's guest job API
+
+        Uses the context's APIRequestContext (shares cookies, no rendering).
+
+        Args:
+            job_id: Numeric LinkedIn job ID
 
+        Returns:
+            Tuple of (description, criteria, easy_apply) or None to fall back to the panel
+        """
         try:
-            job_url = job_card_data["job_url"]
-            card_element = job_card_data["card_element"]
+            response = self.context.request.get(
+                _GUEST_POSTING_URL.format(job_id=job_id), timeout=self.config.timeout
+            )
+        except Exception as e:
+            self.logger.debug(f"Guest API request failed: {e}")
+            return None
 
-            self.logger.debug(f"Expanding job panel for: {job_card_data['title']}")
+        if not response.ok:
+            self.logger.debug(f"Guest API returned status {response.status}, using job panel")
+            return None
 
-            # Dismiss any banners that might interfere with clicking
-            self._dismiss_linkedin_banners()
+        soup = BeautifulSoup(response.text(), "lxml")
 
-            # Click the job card to expand the detail panel
-            try:
-                # Try clicking the card element
-                card_element.click(timeout=3000)
-                self.logger.debug("Clicked job card")
-            except Exception as e:
-                # Fallback: try JavaScript click
-                self.logger.debug(f"Regular click failed, trying JavaScript click: {e}")
-                try:
-                    card_element.evaluate("el => el.click()")
-                except:
-                    self.logger.warning("Could not click job card")
-                    return None
+        desc_element = soup.select_one("div.show-more-less-html__markup") or soup.select_one(
+            "div.description__text"
+        )
+        if not desc_element:
+            return None
+        description = clean_text(desc_element.get_text(" "))
+        if len(description) <= 50:
+            return None
 
-            # Wait for detail panel to load
-            human_delay(1.5, 3.0)
+        criteria = {}
+        for item in soup.select("li.description__job-criteria-item"):
+            header = item.select_one("h3")
+            value = item.select_one("span")
+            if header and value:
+                criteria[header.get_text(strip=True)] = value.get_text(strip=True)
 
-            # Extract description from expanded panel with validation and retries
-            description = self._extract_description_with_retry()
+        # On guest pages Easy Apply jobs use the on-site apply link
+        easy_apply = soup.select_one(
+            '[data-tracking-control-name*="apply-link-onsite"], button.jobs-apply-button'
+        ) is not None
 
-            # Extract additional details from panel
-            criteria = {}
-            try:
-                # Try multiple selectors for job criteria
-                criteria_selectors = [
-                    "li.description__job-criteria-item",
-                    "li.jobs-description__list-item",
-                    "li[class*='job-criteria']",
-                ]
-
-                for selector in criteria_selectors:
-                    criteria_items = self.page.query_selector_all(selector)
-                    if criteria_items:
-                        for item in criteria_items:
-                            try:
-                                header = item.query_selector("h3")
-                                value = item.query_selector("span")
-                                if header and value:
-                                    criteria[header.inner_text().strip()] = value.inner_text().strip()
-                            except:
-                                continue
-                        break
-            except Exception as e:
-                self.logger.debug(f"Could not extract criteria: {e}")
+        self.logger.debug("Job details extracted via guest API")
+        return description, criteria, easy_apply
 
-            # Check for Easy Apply
-            easy_apply = False
+    def _extract_details_from_panel(self, job_card_data: dict) -> Optional[Tuple[str, Dict[str, str], bool]]:
+        """
+        Extract description, criteria and Easy Apply flag by expanding the job panel
+
+        Args:
+            job_card_data: Job card data (uses card_element and title)
+
+        Returns:
+            Tuple of (description, criteria, easy_apply) or None if the card can't be opened
+        """
+        card_element = job_card_data["card_element"]
+
+        self.logger.debug(f"Expanding job panel for: {job_card_data['title']}")
+
+        # Dismiss any banners that might interfere with clicking
+        self._dismiss_linkedin_banners()
+
+        # Click the job card to expand the detail panel
+        try:
+            # Try clicking the card element
+            card_element.click(timeout=3000)
+            self.logger.debug("Clicked job card")
+        except Exception as e:
+            # Fallback: try JavaScript click
+            self.logger.debug(f"Regular click failed, trying JavaScript click: {e}")
             try:
-                easy_apply_selectors = [
-                    "button.jobs-apply-button",
-                    "button[aria-label*='Easy Apply']",
-                    "button[data-control-name*='easy_apply']",
-                ]
-                for selector in easy_apply_selectors:
-                    easy_apply_button = self.page.query_selector(selector)
-                    if easy_apply_button and easy_apply_button.is_visible():
-                        easy_apply = True
-                        break
+                card_element.evaluate("el => el.click()")
             except:
-                pass
+                self.logger.warning("Could not click job card")
+                return None
+
+        # Wait for detail panel to load
+        human_delay(1.5, 3.0)
+
+        # Extract description from expanded panel with validation and retries
+        description = self._extract_description_with_retry()
+
+        # Extract additional details from panel (one round trip per selector)
+        criteria = {}
+        try:
+            for selector in _CRITERIA_SELECTORS:
+                pairs = self.page.eval_on_selector_all(selector, _CRITERIA_JS)
+                if pairs:
+                    criteria = dict(pairs)
+                    break
+        except Exception as e:
+            self.logger.debug(f"Could not extract criteria: {e}")
+
+        # Check for Easy Apply
+        easy_apply = False
+        try:
+            easy_apply = self.page.eval_on_selector_all(_EASY_APPLY_SELECTOR, _ANY_VISIBLE_JS)
+        except Exception:
+            pass
+
+        return description, criteria, easy_apply
+
+    def extract_job_details(self, job_card_data: dict) -> Optional[JobPosting]:
+        """
+        Extract detailed job information from the guest job API, falling back
+        to expanding the job panel (no page navigation either way)
+        """
+
+        try:
+            job_url = job_card_data["job_url"]
+
+            # Fast path: guest API returns the posting HTML without rendering a page
+            guest_posting = self._fetch_guest_job_posting(job_card_data["job_id"])
+            if guest_posting:
+                description, criteria, easy_apply = guest_posting
+            else:
+                self._note_page_use()
+                panel_details = self._extract_details_from_panel(job_card_data)
+                if panel_details is None:
+                    return None
+                description, criteria, easy_apply = panel_details
 
             # Extract keywords from description
             keywords = extract_keywords(description) if description else []
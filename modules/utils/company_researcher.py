@@ -4,10 +4,28 @@ Uses DuckDuckGo to research companies for cover letter personalization
 """
 
 import logging
+import time
 import requests
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from bs4 import BeautifulSoup
 
+# How long cached research stays valid (seconds)
+RESEARCH_CACHE_TTL = 24 * 60 * 60
+
+# Module-level caches shared across researcher instances:
+# company-level facts keyed by company, tech stack keyed by (company, job title).
+# Only found items are cached, so a failed or rate-limited search is retried next time.
+_company_facts_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+_tech_stack_cache: Dict[Tuple[str, str], Tuple[float, str]] = {}
+
+
+def _cache_get(cache: dict, key):
+    """Return a cached value if present and not expired"""
+    entry = cache.get(key)
+    if entry and time.time() - entry[0] < RESEARCH_CACHE_TTL:
+        return entry[1]
+    return None
+
 
 class CompanyResearcher:
     """Researches companies using DuckDuckGo search"""
@@ -34,14 +52,34 @@ class CompanyResearcher:
             self.logger.warning("Company name is Unknown, skipping research")
             return self._empty_research()
 
-        self.logger.info(f"Researching company: {company_name}")
+        company_key = company_name.strip().lower()
 
-        research = {
-            'mission': self._search_mission(company_name),
-            'products': self._search_products(company_name),
-            'recent_news': self._search_news(company_name),
-            'tech_stack': self._search_tech_stack(company_name, job_title)
+        # Company-level facts don't depend on the job title - reuse across postings
+        cached_facts = _cache_get(_company_facts_cache, company_key) or {}
+        searches = {
+            'mission': self._search_mission,
+            'products': self._search_products,
+            'recent_news': self._search_news,
         }
+        missing = [field for field in searches if cached_facts.get(field, 'N/A') == 'N/A']
+        if missing:
+            self.logger.info(f"Researching company: {company_name}")
+            facts = {**cached_facts, **{field: searches[field](company_name) for field in missing}}
+            found = {field: value for field, value in facts.items() if value != 'N/A'}
+            if found:
+                _company_facts_cache[company_key] = (time.time(), found)
+        else:
+            self.logger.info(f"Using cached research for: {company_name}")
+            facts = cached_facts
+
+        tech_key = (company_key, job_title.strip().lower())
+        tech_stack = _cache_get(_tech_stack_cache, tech_key)
+        if tech_stack is None:
+            tech_stack = self._search_tech_stack(company_name, job_title)
+            if tech_stack != 'N/A':
+                _tech_stack_cache[tech_key] = (time.time(), tech_stack)
+
+        research = {**facts, 'tech_stack': tech_stack}
 
         # Log what we found
         found_count = sum(1 for v in research.values() if v != 'N/A')
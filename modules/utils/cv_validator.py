@@ -8,6 +8,18 @@ import re
 from typing import Dict, List, Any, Tuple
 from collections import Counter
 
+# Patterns used on every validation, compiled once at import
+_SCORE_RE = re.compile(
+    r"relevance score[:\s]+\d+/10|score[:\s]+\d+/10|\d+/10\s*relevance|rated \d+/10",
+    re.IGNORECASE,
+)
+_YEAR_RE = re.compile(r"\d{4}")
+_EDU_YEAR_RE = re.compile(r"\b(20\d{2})\b")
+_BULLET_VERB_RE = re.compile(r'•\s*([A-Z][a-z]+)')
+_QUANTIFIED_RE = re.compile(r'\d+[%+]?|\d+,\d+')
+_OUT_OF_TEN_RE = re.compile(r"\d+/10")
+_NUMBER_RE = re.compile(r'\d+[%+]?')
+
 
 class CVValidator:
     """Validates generated CVs for AI tells and quality issues"""
@@ -53,6 +65,11 @@ class CVValidator:
         "EDUCATION"
     ]
 
+    # Compiled forms of the pattern lists above
+    _META_RES = [re.compile(p, re.IGNORECASE) for p in META_PATTERNS]
+    _PLACEHOLDER_RES = [re.compile(p, re.IGNORECASE) for p in PLACEHOLDER_PATTERNS]
+    _SECTION_RES: Dict[str, "re.Pattern[str]"] = {}
+
     def __init__(self):
         self.critical_issues = []
         self.warnings = []
@@ -106,33 +123,24 @@ class CVValidator:
         text_lower = cv_text.lower()
         first_100_chars = text_lower[:100]
 
-        for pattern in self.META_PATTERNS:
-            if re.search(pattern, first_100_chars, re.IGNORECASE):
+        for regex in self._META_RES:
+            if regex.search(first_100_chars):
                 self.critical_issues.append(
-                    f"Meta-commentary detected: '{pattern}'. CV should start directly with name, not commentary."
+                    f"Meta-commentary detected: '{regex.pattern}'. CV should start directly with name, not commentary."
                 )
                 break
 
     def _check_relevance_scores(self, cv_text: str):
         """Check for relevance scores in output"""
-        score_patterns = [
-            r"relevance score[:\s]+\d+/10",
-            r"score[:\s]+\d+/10",
-            r"\d+/10\s*relevance",
-            r"rated \d+/10",
-        ]
-
-        for pattern in score_patterns:
-            if re.search(pattern, cv_text, re.IGNORECASE):
-                self.critical_issues.append(
-                    "Relevance scores found in CV output. Scores should be internal only, not visible in CV."
-                )
-                break
+        if _SCORE_RE.search(cv_text):
+            self.critical_issues.append(
+                "Relevance scores found in CV output. Scores should be internal only, not visible in CV."
+            )
 
     def _check_placeholders(self, cv_text: str):
         """Check for placeholder text"""
-        for pattern in self.PLACEHOLDER_PATTERNS:
-            matches = re.findall(pattern, cv_text, re.IGNORECASE)
+        for regex in self._PLACEHOLDER_RES:
+            matches = regex.findall(cv_text)
             if matches:
                 # Filter out GitHub URLs [URL] which are OK
                 real_placeholders = [m for m in matches if "github" not in m.lower() and "url" not in m.lower()]
@@ -144,11 +152,8 @@ class CVValidator:
 
     def _check_required_sections(self, cv_text: str):
         """Check all required sections are present"""
-        missing_sections = []
-
-        for section in self.REQUIRED_SECTIONS:
-            if section not in cv_text.upper():
-                missing_sections.append(section)
+        text_upper = cv_text.upper()
+        missing_sections = [s for s in self.REQUIRED_SECTIONS if s not in text_upper]
 
         if missing_sections:
             self.critical_issues.append(
@@ -172,13 +177,13 @@ class CVValidator:
         expected_grad = user_info.get("graduation_date", "")
         if expected_grad:
             # Extract year
-            expected_year = re.search(r"\d{4}", expected_grad)
+            expected_year = _YEAR_RE.search(expected_grad)
             if expected_year:
                 year = expected_year.group()
                 # Check if wrong year appears in education section
                 edu_section = self._extract_section(cv_text, "EDUCATION")
                 if edu_section:
-                    years_in_edu = re.findall(r"\b(20\d{2})\b", edu_section)
+                    years_in_edu = _EDU_YEAR_RE.findall(edu_section)
                     # Check if any year is significantly different
                     if years_in_edu:
                         for found_year in years_in_edu:
@@ -225,13 +230,13 @@ class CVValidator:
 
         if cliche_counts:
             self.warnings.append(
-                f"AI clichés overused: {', '.join([f'{k} ({v}x)' for k, v in cliche_counts.items()])}"
+                f"AI clichés overused: {', '.join(f'{k} ({v}x)' for k, v in cliche_counts.items())}"
             )
 
     def _check_action_verb_variety(self, cv_text: str):
         """Check for action verb variety"""
         # Extract bullet points
-        bullets = re.findall(r'•\s*([A-Z][a-z]+)', cv_text)
+        bullets = _BULLET_VERB_RE.findall(cv_text)
 
         if bullets:
             verb_counts = Counter(bullets)
@@ -239,7 +244,7 @@ class CVValidator:
 
             if overused:
                 self.warnings.append(
-                    f"Action verbs overused: {', '.join([f'{k} ({v}x)' for k, v in overused.items()])}"
+                    f"Action verbs overused: {', '.join(f'{k} ({v}x)' for k, v in overused.items())}"
                 )
 
     def _check_quantification(self, cv_text: str):
@@ -251,7 +256,7 @@ class CVValidator:
             # Check how many bullets have numbers/percentages
             quantified = 0
             for bullet in bullets:
-                if re.search(r'\d+[%+]?|\d+,\d+', bullet):
+                if _QUANTIFIED_RE.search(bullet):
                     quantified += 1
 
             if bullets and (quantified / len(bullets)) < 0.5:
@@ -267,11 +272,11 @@ class CVValidator:
         score = 0
 
         # Meta-commentary: +40 points
-        if any(self._check_pattern(cv_text, p) for p in self.META_PATTERNS):
+        if any(regex.search(cv_text) for regex in self._META_RES):
             score += 40
 
         # Relevance scores visible: +30 points
-        if re.search(r"\d+/10", cv_text):
+        if _OUT_OF_TEN_RE.search(cv_text):
             score += 30
 
         # AI clichés: +2 points per occurrence over threshold
@@ -282,7 +287,7 @@ class CVValidator:
                 score += (count - 2) * 2
 
         # Lack of specificity: +10 points
-        if not re.search(r'\d+[%+]?', cv_text):
+        if not _NUMBER_RE.search(cv_text):
             score += 10
 
         # Generic language: +5 points
@@ -295,14 +300,13 @@ class CVValidator:
 
     def _extract_section(self, cv_text: str, section_name: str) -> str:
         """Extract a specific section from CV"""
-        pattern = rf"{section_name}(.*?)(?=\n[A-Z][A-Z\s]+\n|$)"
-        match = re.search(pattern, cv_text, re.DOTALL | re.IGNORECASE)
+        regex = self._SECTION_RES.get(section_name)
+        if regex is None:
+            regex = re.compile(rf"{section_name}(.*?)(?=\n[A-Z][A-Z\s]+\n|$)", re.DOTALL | re.IGNORECASE)
+            self._SECTION_RES[section_name] = regex
+        match = regex.search(cv_text)
         return match.group(1).strip() if match else ""
 
-    def _check_pattern(self, text: str, pattern: str) -> bool:
-        """Check if pattern exists in text"""
-        return bool(re.search(pattern, text, re.IGNORECASE))
-
     def format_validation_report(self, result: Dict[str, Any]) -> str:
         """Format validation result as readable report"""
         report = []
@@ -3,14 +3,39 @@ Helper utilities for the job application bot
 """
 
 import re
+import json
 import time
 import random
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from pathlib import Path
 from datetime import datetime
 import hashlib
+from functools import lru_cache
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+# Characters not allowed in filenames on common filesystems
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+# Runs of whitespace collapsed by clean_text
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Salary amounts for parse_salary (range first, then a single figure)
+_SALARY_RANGE_RE = re.compile(r"[£$€]?(\d+).*?[£$€]?(\d+)")
+_SALARY_RE = re.compile(r"[£$€]?(\d+)")
+
+
+@lru_cache(maxsize=8)
+def _keyword_re(min_length: int) -> "re.Pattern[str]":
+    """Compiled extract_keywords pattern for a minimum word length"""
+    return re.compile(r"\b[a-zA-Z+#]{" + str(min_length) + r",}\b")
+
+
+@lru_cache(maxsize=1024)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename by removing invalid characters
@@ -22,7 +47,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename safe for filesystem
     """
     # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', "", filename)
+    filename = _INVALID_FILENAME_CHARS.sub("", filename)
     # Replace spaces with underscores
     filename = filename.replace(" ", "_")
     # Limit length
@@ -31,6 +56,39 @@ def sanitize_filename(filename: str) -> str:
     return filename
 
 
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with orjson when installed, falling back to the stdlib
+
+    Both raise a json.JSONDecodeError subclass on invalid input.
+
+    Args:
+        data: JSON text or UTF-8 bytes
+
+    Returns:
+        Parsed object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes with orjson when installed
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        Encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
 def generate_job_id(company: str, title: str, platform: str) -> str:
     """
     Generate a unique job ID from company, title, and platform
@@ -59,7 +117,7 @@ def extract_keywords(text: str, min_length: int = 3) -> List[str]:
         List of keywords
     """
     # Remove special characters and split into words
-    words = re.findall(r"\b[a-zA-Z+#]{" + str(min_length) + r",}\b", text)
+    words = _keyword_re(min_length).findall(text)
     # Convert to lowercase and remove duplicates
     keywords = list(set(word.lower() for word in words))
     return keywords
@@ -160,7 +218,7 @@ def parse_salary(salary_text: str) -> Optional[Dict[str, Any]]:
     salary_text = salary_text.replace(",", "")
 
     # Try to match salary range
-    match = re.search(r"[£$€]?(\d+).*?[£$€]?(\d+)", salary_text)
+    match = _SALARY_RANGE_RE.search(salary_text)
     if match:
         return {
             "min": int(match.group(1)),
@@ -170,7 +228,7 @@ def parse_salary(salary_text: str) -> Optional[Dict[str, Any]]:
         }
 
     # Try to match single salary
-    match = re.search(r"[£$€]?(\d+)", salary_text)
+    match = _SALARY_RE.search(salary_text)
     if match:
         return {
             "amount": int(match.group(1)),
@@ -206,7 +264,7 @@ def clean_text(text: str) -> str:
         Cleaned text
     """
     # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     # Remove leading/trailing whitespace
     text = text.strip()
     return text
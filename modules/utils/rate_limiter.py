@@ -0,0 +1,83 @@
+"""
+Rate Limiter
+
+Token-bucket rate limiting for requests to job platforms
+"""
+
+import time
+import threading
+from typing import Dict
+
+from modules.utils.helpers import rate_limit_delay
+
+# Requests a platform bucket lets through back-to-back after an idle period
+DEFAULT_BURST = 3
+
+
+class TokenBucket:
+    """
+    Token bucket: allows short bursts up to capacity while holding the
+    long-run rate at `rate` requests per second
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        """
+        Initialize token bucket
+
+        Args:
+            capacity: Maximum tokens (burst size)
+            rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: float = 1) -> float:
+        """
+        Take n tokens, sleeping only if the bucket doesn't have them
+
+        The tokens are reserved under the lock and the sleep happens outside
+        it, so concurrent callers queue up fairly.
+
+        Args:
+            n: Number of tokens to take
+
+        Returns:
+            Seconds slept
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= n
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(platform: str) -> TokenBucket:
+    """
+    Get the shared token bucket for a platform
+
+    The refill rate comes from rate_limit_delay, so the sustained request
+    rate matches the platform's configured delay.
+
+    Args:
+        platform: Platform name
+
+    Returns:
+        TokenBucket for the platform
+    """
+    key = platform.lower()
+    with _buckets_lock:
+        if key not in _buckets:
+            _buckets[key] = TokenBucket(capacity=DEFAULT_BURST, rate=1.0 / rate_limit_delay(key))
+        return _buckets[key]